@@ -14,8 +14,9 @@ Structure:
 from __future__ import annotations
 
 import struct
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from io import BytesIO
+from operator import attrgetter
 
 
 @dataclass
@@ -226,415 +227,24 @@ class FacePreset:
     @classmethod
     def read(cls, f: BytesIO) -> FacePreset:
         """Read FacePreset from stream (0x130 bytes)"""
-        obj = cls()
-        
-        # Header (0x18 bytes)
-        obj.unk0x00 = f.read(0x14)  # 20 bytes
-        obj.face_data_marker = struct.unpack("<i", f.read(4))[0]
-        
-        # Magic section
-        obj.magic = f.read(4)
-        obj.alignment = struct.unpack("<I", f.read(4))[0]
-        obj.size = struct.unpack("<I", f.read(4))[0]
-        
-        # Face models (each followed by 3 bytes padding)
-        obj.face_model = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.hair_model = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.unk0x14 = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.eyebrow_model = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.beard_model = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.eyepatch_model = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.unk0x24 = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        obj.unk0x28 = struct.unpack("<B", f.read(1))[0]
-        f.read(3)  # padding
-        
-        # Facial structure (68 bytes)
-        obj.apparent_age = struct.unpack("<B", f.read(1))[0]
-        obj.facial_aesthetic = struct.unpack("<B", f.read(1))[0]
-        obj.form_emphasis = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x2f = struct.unpack("<B", f.read(1))[0]
-        obj.brow_ridge_height = struct.unpack("<B", f.read(1))[0]
-        obj.inner_brow_ridge = struct.unpack("<B", f.read(1))[0]
-        obj.outer_brow_ridge = struct.unpack("<B", f.read(1))[0]
-        obj.cheekbone_height = struct.unpack("<B", f.read(1))[0]
-        obj.cheekbone_depth = struct.unpack("<B", f.read(1))[0]
-        obj.cheekbone_width = struct.unpack("<B", f.read(1))[0]
-        obj.cheekbone_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.cheeks = struct.unpack("<B", f.read(1))[0]
-        obj.chin_tip_position = struct.unpack("<B", f.read(1))[0]
-        obj.chin_length = struct.unpack("<B", f.read(1))[0]
-        obj.chin_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.chin_depth = struct.unpack("<B", f.read(1))[0]
-        obj.chin_size = struct.unpack("<B", f.read(1))[0]
-        obj.chin_height = struct.unpack("<B", f.read(1))[0]
-        obj.chin_width = struct.unpack("<B", f.read(1))[0]
-        obj.eye_position = struct.unpack("<B", f.read(1))[0]
-        obj.eye_size = struct.unpack("<B", f.read(1))[0]
-        obj.eye_slant = struct.unpack("<B", f.read(1))[0]
-        obj.eye_spacing = struct.unpack("<B", f.read(1))[0]
-        obj.nose_size = struct.unpack("<B", f.read(1))[0]
-        obj.nose_forehead_ratio = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x45 = struct.unpack("<B", f.read(1))[0]
-        obj.face_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.vertical_face_ratio = struct.unpack("<B", f.read(1))[0]
-        obj.facial_feature_slant = struct.unpack("<B", f.read(1))[0]
-        obj.horizontal_face_ratio = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x4a = struct.unpack("<B", f.read(1))[0]
-        obj.forehead_depth = struct.unpack("<B", f.read(1))[0]
-        obj.forehead_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.unk0x4d = struct.unpack("<B", f.read(1))[0]
-        obj.jaw_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.jaw_width = struct.unpack("<B", f.read(1))[0]
-        obj.lower_jaw = struct.unpack("<B", f.read(1))[0]
-        obj.jaw_contour = struct.unpack("<B", f.read(1))[0]
-        obj.lip_shape = struct.unpack("<B", f.read(1))[0]
-        obj.lip_size = struct.unpack("<B", f.read(1))[0]
-        obj.lip_fullness = struct.unpack("<B", f.read(1))[0]
-        obj.mouth_expression = struct.unpack("<B", f.read(1))[0]
-        obj.lip_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.lip_thickness = struct.unpack("<B", f.read(1))[0]
-        obj.mouth_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.mouth_slant = struct.unpack("<B", f.read(1))[0]
-        obj.occlusion = struct.unpack("<B", f.read(1))[0]
-        obj.mouth_position = struct.unpack("<B", f.read(1))[0]
-        obj.mouth_width = struct.unpack("<B", f.read(1))[0]
-        obj.mouth_chin_distance = struct.unpack("<B", f.read(1))[0]
-        obj.nose_ridge_depth = struct.unpack("<B", f.read(1))[0]
-        obj.nose_ridge_length = struct.unpack("<B", f.read(1))[0]
-        obj.nose_position = struct.unpack("<B", f.read(1))[0]
-        obj.nose_tip_height = struct.unpack("<B", f.read(1))[0]
-        obj.nostril_slant = struct.unpack("<B", f.read(1))[0]
-        obj.nostril_size = struct.unpack("<B", f.read(1))[0]
-        obj.nostril_width = struct.unpack("<B", f.read(1))[0]
-        obj.nose_protrusion = struct.unpack("<B", f.read(1))[0]
-        obj.nose_bridge_height = struct.unpack("<B", f.read(1))[0]
-        obj.bridge_protrusion1 = struct.unpack("<B", f.read(1))[0]
-        obj.bridge_protrusion2 = struct.unpack("<B", f.read(1))[0]
-        obj.nose_bridge_width = struct.unpack("<B", f.read(1))[0]
-        obj.nose_height = struct.unpack("<B", f.read(1))[0]
-        obj.nose_slant = struct.unpack("<B", f.read(1))[0]
-        
-        # Unknown block (64 bytes)
-        obj.unk0x6c = f.read(64)
-        
-        # Body proportions (5 bytes)
-        obj.head_size = struct.unpack("<B", f.read(1))[0]
-        obj.chest_size = struct.unpack("<B", f.read(1))[0]
-        obj.abdomen_size = struct.unpack("<B", f.read(1))[0]
-        obj.arms_size = struct.unpack("<B", f.read(1))[0]
-        obj.legs_size = struct.unpack("<B", f.read(1))[0]
-        
-        # Unknown (2 bytes)
-        obj.unk0xb1 = f.read(2)
-        
-        # Skin and cosmetics (88 bytes)
-        obj.skin_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.skin_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.skin_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.skin_luster = struct.unpack("<B", f.read(1))[0]
-        obj.pores = struct.unpack("<B", f.read(1))[0]
-        obj.stubble = struct.unpack("<B", f.read(1))[0]
-        obj.dark_circles = struct.unpack("<B", f.read(1))[0]
-        obj.dark_circle_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.dark_circle_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.dark_circle_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.cheeks_color_intensity = struct.unpack("<B", f.read(1))[0]
-        obj.cheek_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.cheek_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.cheek_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.eye_liner = struct.unpack("<B", f.read(1))[0]
-        obj.eye_liner_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.eye_liner_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.eye_liner_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_lower = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_lower_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_lower_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_lower_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_upper = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_upper_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_upper_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.eye_shadow_upper_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.lip_stick = struct.unpack("<B", f.read(1))[0]
-        obj.lip_stick_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.lip_stick_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.lip_stick_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_position_horizontal = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_position_vertical = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_angle = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_expansion = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.unk0xd8 = struct.unpack("<B", f.read(1))[0]
-        obj.tattoo_mark_flip = struct.unpack("<B", f.read(1))[0]
-        obj.body_hair = struct.unpack("<B", f.read(1))[0]
-        obj.body_hair_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.body_hair_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.body_hair_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.right_iris_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.right_iris_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.right_iris_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.right_iris_size = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_clouding = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_clouding_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_clouding_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_clouding_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_white_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_white_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_white_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.right_eye_position = struct.unpack("<B", f.read(1))[0]
-        obj.left_iris_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.left_iris_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.left_iris_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.left_iris_size = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_clouding = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_clouding_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_clouding_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_clouding_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_white_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_white_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_white_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.left_eye_position = struct.unpack("<B", f.read(1))[0]
-        obj.hair_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.hair_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.hair_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.luster = struct.unpack("<B", f.read(1))[0]
-        obj.hair_root_darkness = struct.unpack("<B", f.read(1))[0]
-        obj.white_hairs = struct.unpack("<B", f.read(1))[0]
-        obj.beard_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.beard_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.beard_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.beard_luster = struct.unpack("<B", f.read(1))[0]
-        obj.beard_root_darkness = struct.unpack("<B", f.read(1))[0]
-        obj.beard_white_hairs = struct.unpack("<B", f.read(1))[0]
-        obj.brow_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.brow_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.brow_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.brow_luster = struct.unpack("<B", f.read(1))[0]
-        obj.brow_root_darkness = struct.unpack("<B", f.read(1))[0]
-        obj.brow_white_hairs = struct.unpack("<B", f.read(1))[0]
-        obj.eye_lash_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.eye_lash_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.eye_lash_color_b = struct.unpack("<B", f.read(1))[0]
-        obj.eye_patch_color_r = struct.unpack("<B", f.read(1))[0]
-        obj.eye_patch_color_g = struct.unpack("<B", f.read(1))[0]
-        obj.eye_patch_color_b = struct.unpack("<B", f.read(1))[0]
-        
-        # Padding (10 bytes)
-        obj.pad = f.read(10)
-        
+        return cls.from_bytes(f.read(FACE_PRESET_SIZE))
+    
+    @classmethod
+    def from_bytes(cls, buf, offset: int = 0) -> FacePreset:
+        """Decode a FacePreset from buf at offset in a single unpack"""
+        obj = cls.__new__(cls)
+        obj.__dict__.update(
+            zip(FACE_PRESET_FIELDS, _FACE_PRESET_STRUCT.unpack_from(buf, offset), strict=True)
+        )
         return obj
     
+    def to_bytes(self) -> bytes:
+        """Encode FacePreset (0x130 bytes) in a single pack"""
+        return _FACE_PRESET_STRUCT.pack(*_face_preset_values(self))
+    
     def write(self, f: BytesIO) -> None:
         """Write FacePreset to stream (0x130 bytes)"""
-        # Header
-        f.write(self.unk0x00)
-        f.write(struct.pack("<i", self.face_data_marker))
-        
-        # Magic section
-        f.write(self.magic)
-        f.write(struct.pack("<I", self.alignment))
-        f.write(struct.pack("<I", self.size))
-        
-        # Face models (each followed by 3 bytes padding)
-        f.write(struct.pack("<B", self.face_model))
-        f.write(b"\x00" * 3)
-        f.write(struct.pack("<B", self.hair_model))
-        f.write(b"\x00" * 3)
-        f.write(struct.pack("<B", self.unk0x14))
-        f.write(b"\x00" * 3)
-        f.write(struct.pack("<B", self.eyebrow_model))
-        f.write(b"\x00" * 3)
-        f.write(struct.pack("<B", self.beard_model))
-        f.write(b"\x00" * 3)
-        f.write(struct.pack("<B", self.eyepatch_model))
-        f.write(b"\x00" * 3)
-        f.write(struct.pack("<B", self.unk0x24))
-        f.write(b"\x00" * 3)
-        f.write(struct.pack("<B", self.unk0x28))
-        f.write(b"\x00" * 3)
-        
-        # Facial structure
-        f.write(struct.pack("<B", self.apparent_age))
-        f.write(struct.pack("<B", self.facial_aesthetic))
-        f.write(struct.pack("<B", self.form_emphasis))
-        f.write(struct.pack("<B", self.unk0x2f))
-        f.write(struct.pack("<B", self.brow_ridge_height))
-        f.write(struct.pack("<B", self.inner_brow_ridge))
-        f.write(struct.pack("<B", self.outer_brow_ridge))
-        f.write(struct.pack("<B", self.cheekbone_height))
-        f.write(struct.pack("<B", self.cheekbone_depth))
-        f.write(struct.pack("<B", self.cheekbone_width))
-        f.write(struct.pack("<B", self.cheekbone_protrusion))
-        f.write(struct.pack("<B", self.cheeks))
-        f.write(struct.pack("<B", self.chin_tip_position))
-        f.write(struct.pack("<B", self.chin_length))
-        f.write(struct.pack("<B", self.chin_protrusion))
-        f.write(struct.pack("<B", self.chin_depth))
-        f.write(struct.pack("<B", self.chin_size))
-        f.write(struct.pack("<B", self.chin_height))
-        f.write(struct.pack("<B", self.chin_width))
-        f.write(struct.pack("<B", self.eye_position))
-        f.write(struct.pack("<B", self.eye_size))
-        f.write(struct.pack("<B", self.eye_slant))
-        f.write(struct.pack("<B", self.eye_spacing))
-        f.write(struct.pack("<B", self.nose_size))
-        f.write(struct.pack("<B", self.nose_forehead_ratio))
-        f.write(struct.pack("<B", self.unk0x45))
-        f.write(struct.pack("<B", self.face_protrusion))
-        f.write(struct.pack("<B", self.vertical_face_ratio))
-        f.write(struct.pack("<B", self.facial_feature_slant))
-        f.write(struct.pack("<B", self.horizontal_face_ratio))
-        f.write(struct.pack("<B", self.unk0x4a))
-        f.write(struct.pack("<B", self.forehead_depth))
-        f.write(struct.pack("<B", self.forehead_protrusion))
-        f.write(struct.pack("<B", self.unk0x4d))
-        f.write(struct.pack("<B", self.jaw_protrusion))
-        f.write(struct.pack("<B", self.jaw_width))
-        f.write(struct.pack("<B", self.lower_jaw))
-        f.write(struct.pack("<B", self.jaw_contour))
-        f.write(struct.pack("<B", self.lip_shape))
-        f.write(struct.pack("<B", self.lip_size))
-        f.write(struct.pack("<B", self.lip_fullness))
-        f.write(struct.pack("<B", self.mouth_expression))
-        f.write(struct.pack("<B", self.lip_protrusion))
-        f.write(struct.pack("<B", self.lip_thickness))
-        f.write(struct.pack("<B", self.mouth_protrusion))
-        f.write(struct.pack("<B", self.mouth_slant))
-        f.write(struct.pack("<B", self.occlusion))
-        f.write(struct.pack("<B", self.mouth_position))
-        f.write(struct.pack("<B", self.mouth_width))
-        f.write(struct.pack("<B", self.mouth_chin_distance))
-        f.write(struct.pack("<B", self.nose_ridge_depth))
-        f.write(struct.pack("<B", self.nose_ridge_length))
-        f.write(struct.pack("<B", self.nose_position))
-        f.write(struct.pack("<B", self.nose_tip_height))
-        f.write(struct.pack("<B", self.nostril_slant))
-        f.write(struct.pack("<B", self.nostril_size))
-        f.write(struct.pack("<B", self.nostril_width))
-        f.write(struct.pack("<B", self.nose_protrusion))
-        f.write(struct.pack("<B", self.nose_bridge_height))
-        f.write(struct.pack("<B", self.bridge_protrusion1))
-        f.write(struct.pack("<B", self.bridge_protrusion2))
-        f.write(struct.pack("<B", self.nose_bridge_width))
-        f.write(struct.pack("<B", self.nose_height))
-        f.write(struct.pack("<B", self.nose_slant))
-        
-        # Unknown block
-        f.write(self.unk0x6c)
-        
-        # Body proportions
-        f.write(struct.pack("<B", self.head_size))
-        f.write(struct.pack("<B", self.chest_size))
-        f.write(struct.pack("<B", self.abdomen_size))
-        f.write(struct.pack("<B", self.arms_size))
-        f.write(struct.pack("<B", self.legs_size))
-        
-        # Unknown
-        f.write(self.unk0xb1)
-        
-        # Skin and cosmetics
-        f.write(struct.pack("<B", self.skin_color_r))
-        f.write(struct.pack("<B", self.skin_color_g))
-        f.write(struct.pack("<B", self.skin_color_b))
-        f.write(struct.pack("<B", self.skin_luster))
-        f.write(struct.pack("<B", self.pores))
-        f.write(struct.pack("<B", self.stubble))
-        f.write(struct.pack("<B", self.dark_circles))
-        f.write(struct.pack("<B", self.dark_circle_color_r))
-        f.write(struct.pack("<B", self.dark_circle_color_g))
-        f.write(struct.pack("<B", self.dark_circle_color_b))
-        f.write(struct.pack("<B", self.cheeks_color_intensity))
-        f.write(struct.pack("<B", self.cheek_color_r))
-        f.write(struct.pack("<B", self.cheek_color_g))
-        f.write(struct.pack("<B", self.cheek_color_b))
-        f.write(struct.pack("<B", self.eye_liner))
-        f.write(struct.pack("<B", self.eye_liner_color_r))
-        f.write(struct.pack("<B", self.eye_liner_color_g))
-        f.write(struct.pack("<B", self.eye_liner_color_b))
-        f.write(struct.pack("<B", self.eye_shadow_lower))
-        f.write(struct.pack("<B", self.eye_shadow_lower_color_r))
-        f.write(struct.pack("<B", self.eye_shadow_lower_color_g))
-        f.write(struct.pack("<B", self.eye_shadow_lower_color_b))
-        f.write(struct.pack("<B", self.eye_shadow_upper))
-        f.write(struct.pack("<B", self.eye_shadow_upper_color_r))
-        f.write(struct.pack("<B", self.eye_shadow_upper_color_g))
-        f.write(struct.pack("<B", self.eye_shadow_upper_color_b))
-        f.write(struct.pack("<B", self.lip_stick))
-        f.write(struct.pack("<B", self.lip_stick_color_r))
-        f.write(struct.pack("<B", self.lip_stick_color_g))
-        f.write(struct.pack("<B", self.lip_stick_color_b))
-        f.write(struct.pack("<B", self.tattoo_mark_position_horizontal))
-        f.write(struct.pack("<B", self.tattoo_mark_position_vertical))
-        f.write(struct.pack("<B", self.tattoo_mark_angle))
-        f.write(struct.pack("<B", self.tattoo_mark_expansion))
-        f.write(struct.pack("<B", self.tattoo_mark_color_r))
-        f.write(struct.pack("<B", self.tattoo_mark_color_g))
-        f.write(struct.pack("<B", self.tattoo_mark_color_b))
-        f.write(struct.pack("<B", self.unk0xd8))
-        f.write(struct.pack("<B", self.tattoo_mark_flip))
-        f.write(struct.pack("<B", self.body_hair))
-        f.write(struct.pack("<B", self.body_hair_color_r))
-        f.write(struct.pack("<B", self.body_hair_color_g))
-        f.write(struct.pack("<B", self.body_hair_color_b))
-        f.write(struct.pack("<B", self.right_iris_color_r))
-        f.write(struct.pack("<B", self.right_iris_color_g))
-        f.write(struct.pack("<B", self.right_iris_color_b))
-        f.write(struct.pack("<B", self.right_iris_size))
-        f.write(struct.pack("<B", self.right_eye_clouding))
-        f.write(struct.pack("<B", self.right_eye_clouding_color_r))
-        f.write(struct.pack("<B", self.right_eye_clouding_color_g))
-        f.write(struct.pack("<B", self.right_eye_clouding_color_b))
-        f.write(struct.pack("<B", self.right_eye_white_color_r))
-        f.write(struct.pack("<B", self.right_eye_white_color_g))
-        f.write(struct.pack("<B", self.right_eye_white_color_b))
-        f.write(struct.pack("<B", self.right_eye_position))
-        f.write(struct.pack("<B", self.left_iris_color_r))
-        f.write(struct.pack("<B", self.left_iris_color_g))
-        f.write(struct.pack("<B", self.left_iris_color_b))
-        f.write(struct.pack("<B", self.left_iris_size))
-        f.write(struct.pack("<B", self.left_eye_clouding))
-        f.write(struct.pack("<B", self.left_eye_clouding_color_r))
-        f.write(struct.pack("<B", self.left_eye_clouding_color_g))
-        f.write(struct.pack("<B", self.left_eye_clouding_color_b))
-        f.write(struct.pack("<B", self.left_eye_white_color_r))
-        f.write(struct.pack("<B", self.left_eye_white_color_g))
-        f.write(struct.pack("<B", self.left_eye_white_color_b))
-        f.write(struct.pack("<B", self.left_eye_position))
-        f.write(struct.pack("<B", self.hair_color_r))
-        f.write(struct.pack("<B", self.hair_color_g))
-        f.write(struct.pack("<B", self.hair_color_b))
-        f.write(struct.pack("<B", self.luster))
-        f.write(struct.pack("<B", self.hair_root_darkness))
-        f.write(struct.pack("<B", self.white_hairs))
-        f.write(struct.pack("<B", self.beard_color_r))
-        f.write(struct.pack("<B", self.beard_color_g))
-        f.write(struct.pack("<B", self.beard_color_b))
-        f.write(struct.pack("<B", self.beard_luster))
-        f.write(struct.pack("<B", self.beard_root_darkness))
-        f.write(struct.pack("<B", self.beard_white_hairs))
-        f.write(struct.pack("<B", self.brow_color_r))
-        f.write(struct.pack("<B", self.brow_color_g))
-        f.write(struct.pack("<B", self.brow_color_b))
-        f.write(struct.pack("<B", self.brow_luster))
-        f.write(struct.pack("<B", self.brow_root_darkness))
-        f.write(struct.pack("<B", self.brow_white_hairs))
-        f.write(struct.pack("<B", self.eye_lash_color_r))
-        f.write(struct.pack("<B", self.eye_lash_color_g))
-        f.write(struct.pack("<B", self.eye_lash_color_b))
-        f.write(struct.pack("<B", self.eye_patch_color_r))
-        f.write(struct.pack("<B", self.eye_patch_color_g))
-        f.write(struct.pack("<B", self.eye_patch_color_b))
-        
-        # Padding
-        f.write(self.pad)
+        f.write(self.to_bytes())
     
     def is_empty(self) -> bool:
         """Check if preset slot is empty"""
@@ -646,6 +256,49 @@ class FacePreset:
             return self.unk0x00[9]
         return 0
     
+    # Color strings are memoized per (prefix, format) in _rgb_str_cache.
+    # Assigning any field drops the memo, so the text never goes stale.
+    
+    def __setattr__(self, name, value):
+        self.__dict__.pop("_rgb_str_cache", None)
+        super().__setattr__(name, value)
+    
+    def _rgb_str(self, prefix: str, fmt: str) -> str:
+        """Color fields <prefix>_r/_g/_b formatted with fmt, memoized"""
+        cache = self.__dict__.setdefault("_rgb_str_cache", {})
+        text = cache.get((prefix, fmt))
+        if text is None:
+            rgb = (getattr(self, f"{prefix}_{c}") for c in "rgb")
+            text = cache[prefix, fmt] = fmt.format(*rgb)
+        return text
+    
+    @property
+    def skin_rgb_str(self) -> str:
+        """Skin color as fixed-width "RGB(rrr,ggg,bbb)" for list columns"""
+        return self._rgb_str("skin_color", "RGB({:3d},{:3d},{:3d})")
+    
+    @property
+    def hair_rgb_str(self) -> str:
+        """Hair color as fixed-width "RGB(rrr,ggg,bbb)" for list columns"""
+        return self._rgb_str("hair_color", "RGB({:3d},{:3d},{:3d})")
+    
+    def rgb_str(self, prefix: str) -> str:
+        """Color fields <prefix>_r/_g/_b as RGB(r, g, b) for the detail report"""
+        return self._rgb_str(prefix, "RGB({}, {}, {})")
+    
+    def detail_values(self, slot: int) -> dict:
+        """Fields plus slot, body type and optional color lines for PRESET_DETAIL_TEMPLATE"""
+        values = vars(self) | {
+            "slot": slot,
+            "body_type": "Type A (Male)" if self.get_body_type() == 0 else "Type B (Female)",
+        }
+        for intensity, color, label in DETAIL_OPTIONAL_COLORS:
+            if getattr(self, intensity) > 0:
+                values[f"{intensity}_color"] = f"{label}{self.rgb_str(color)}\n"
+            else:
+                values[f"{intensity}_color"] = ""
+        return values
+
     def to_dict(self) -> dict:
         """Export ALL parameters to dictionary"""
         return {
@@ -1097,6 +750,212 @@ class FacePreset:
 
 
 
+# Binary layout of one FacePreset, in file order and in the order of its
+# dataclass fields. The 3 bytes after each face model are padding: skipped
+# when reading and written back as zeros.
+_FACE_PRESET_STRUCT = struct.Struct(
+    "<20si4sII"   # Header and magic section
+    + "B3x" * 8   # Face models
+    + "64B"       # Facial structure
+    + "64s"       # Unknown block
+    + "5B"        # Body proportions
+    + "2s"        # Unknown
+    + "91B"       # Skin and cosmetics
+    + "10s"       # Padding
+)
+FACE_PRESET_SIZE = _FACE_PRESET_STRUCT.size  # 0x130
+
+FACE_PRESET_FIELDS = tuple(f.name for f in fields(FacePreset))
+_face_preset_values = attrgetter(*FACE_PRESET_FIELDS)
+
+# Every dataclass field must have exactly one struct item, in the same order.
+# Checked with a raise rather than assert, which the frozen build strips.
+if len(FACE_PRESET_FIELDS) != len(_FACE_PRESET_STRUCT.unpack(bytes(FACE_PRESET_SIZE))):
+    raise TypeError("FacePreset fields do not match the preset struct layout")
+
+# Cosmetics whose color line is only shown when the intensity is non-zero:
+# (intensity field, color field prefix, line label)
+DETAIL_OPTIONAL_COLORS = (
+    ("dark_circles", "dark_circle_color", "    Color: "),
+    ("cheeks_color_intensity", "cheek_color", "    Color: "),
+    ("eye_liner", "eye_liner_color", "    Color: "),
+    ("eye_shadow_lower", "eye_shadow_lower_color", "    Color: "),
+    ("eye_shadow_upper", "eye_shadow_upper_color", "    Color: "),
+    ("lip_stick", "lip_stick_color", "    Color: "),
+    ("body_hair", "body_hair_color", "  Color:     "),
+)
+
+# Preset detail report shared by the CLI info command and the GUI detail popup,
+# filled with str.format_map(preset.detail_values(slot))
+PRESET_DETAIL_TEMPLATE = """\
+============================================================
+PRESET SLOT {slot}
+============================================================
+
+Body Type: {body_type}
+
+MODELS:
+  Face Model:    {face_model}
+  Hair Model:    {hair_model}
+  Eyebrow Model: {eyebrow_model}
+  Beard Model:   {beard_model}
+  Eye Patch:     {eyepatch_model}
+
+FACIAL STRUCTURE:
+  Apparent Age:      {apparent_age}
+  Facial Aesthetic:  {facial_aesthetic}
+  Form Emphasis:     {form_emphasis}
+
+  Brow Ridge:
+    Height: {brow_ridge_height}
+    Inner:  {inner_brow_ridge}
+    Outer:  {outer_brow_ridge}
+
+  Cheekbones:
+    Height:     {cheekbone_height}
+    Depth:      {cheekbone_depth}
+    Width:      {cheekbone_width}
+    Protrusion: {cheekbone_protrusion}
+  Cheeks: {cheeks}
+
+  Chin:
+    Tip Position: {chin_tip_position}
+    Length:       {chin_length}
+    Protrusion:   {chin_protrusion}
+    Depth:        {chin_depth}
+    Size:         {chin_size}
+    Height:       {chin_height}
+    Width:        {chin_width}
+
+  Eyes:
+    Position: {eye_position}
+    Size:     {eye_size}
+    Slant:    {eye_slant}
+    Spacing:  {eye_spacing}
+
+  Nose:
+    Size:            {nose_size}
+    Forehead Ratio:  {nose_forehead_ratio}
+    Ridge Depth:     {nose_ridge_depth}
+    Ridge Length:    {nose_ridge_length}
+    Position:        {nose_position}
+    Tip Height:      {nose_tip_height}
+    Nostril Slant:   {nostril_slant}
+    Nostril Size:    {nostril_size}
+    Nostril Width:   {nostril_width}
+    Protrusion:      {nose_protrusion}
+    Bridge Height:   {nose_bridge_height}
+    Bridge Prot. 1:  {bridge_protrusion1}
+    Bridge Prot. 2:  {bridge_protrusion2}
+    Bridge Width:    {nose_bridge_width}
+    Height:          {nose_height}
+    Slant:           {nose_slant}
+
+  Face Shape:
+    Protrusion:          {face_protrusion}
+    Vertical Ratio:      {vertical_face_ratio}
+    Feature Slant:       {facial_feature_slant}
+    Horizontal Ratio:    {horizontal_face_ratio}
+
+  Forehead:
+    Depth:      {forehead_depth}
+    Protrusion: {forehead_protrusion}
+
+  Jaw:
+    Protrusion: {jaw_protrusion}
+    Width:      {jaw_width}
+    Lower:      {lower_jaw}
+    Contour:    {jaw_contour}
+
+  Lips:
+    Shape:      {lip_shape}
+    Size:       {lip_size}
+    Fullness:   {lip_fullness}
+    Protrusion: {lip_protrusion}
+    Thickness:  {lip_thickness}
+
+  Mouth:
+    Expression:     {mouth_expression}
+    Protrusion:     {mouth_protrusion}
+    Slant:          {mouth_slant}
+    Occlusion:      {occlusion}
+    Position:       {mouth_position}
+    Width:          {mouth_width}
+    Chin Distance:  {mouth_chin_distance}
+
+BODY PROPORTIONS:
+  Head:    {head_size}
+  Chest:   {chest_size}
+  Abdomen: {abdomen_size}
+  Arms:    {arms_size}
+  Legs:    {legs_size}
+
+COLORS:
+  Skin:       RGB({skin_color_r:3d}, {skin_color_g:3d}, {skin_color_b:3d})
+    Luster: {skin_luster}
+    Pores:  {pores}
+
+  Hair:       RGB({hair_color_r:3d}, {hair_color_g:3d}, {hair_color_b:3d})
+    Luster:        {luster}
+    Root Darkness: {hair_root_darkness}
+    White Hairs:   {white_hairs}
+
+  Beard:      RGB({beard_color_r:3d}, {beard_color_g:3d}, {beard_color_b:3d})
+    Luster:        {beard_luster}
+    Root Darkness: {beard_root_darkness}
+    White Hairs:   {beard_white_hairs}
+
+  Eyebrows:   RGB({brow_color_r:3d}, {brow_color_g:3d}, {brow_color_b:3d})
+    Luster:        {brow_luster}
+    Root Darkness: {brow_root_darkness}
+    White Hairs:   {brow_white_hairs}
+
+  Eyelashes:  RGB({eye_lash_color_r:3d}, {eye_lash_color_g:3d}, {eye_lash_color_b:3d})
+  Eye Patch:  RGB({eye_patch_color_r:3d}, {eye_patch_color_g:3d}, {eye_patch_color_b:3d})
+
+  Left Eye:   RGB({left_iris_color_r:3d}, {left_iris_color_g:3d}, {left_iris_color_b:3d})
+    Iris Size:  {left_iris_size}
+    Clouding:   {left_eye_clouding}
+    Cloud RGB:  ({left_eye_clouding_color_r}, {left_eye_clouding_color_g}, {left_eye_clouding_color_b})
+    White RGB:  ({left_eye_white_color_r}, {left_eye_white_color_g}, {left_eye_white_color_b})
+    Position:   {left_eye_position}
+
+  Right Eye:  RGB({right_iris_color_r:3d}, {right_iris_color_g:3d}, {right_iris_color_b:3d})
+    Iris Size:  {right_iris_size}
+    Clouding:   {right_eye_clouding}
+    Cloud RGB:  ({right_eye_clouding_color_r}, {right_eye_clouding_color_g}, {right_eye_clouding_color_b})
+    White RGB:  ({right_eye_white_color_r}, {right_eye_white_color_g}, {right_eye_white_color_b})
+    Position:   {right_eye_position}
+
+COSMETICS:
+  Stubble:       {stubble}
+
+  Dark Circles:  {dark_circles}
+{dark_circles_color}
+  Cheek Color:   {cheeks_color_intensity}
+{cheeks_color_intensity_color}
+  Eye Liner:     {eye_liner}
+{eye_liner_color}
+  Eye Shadow (Lower): {eye_shadow_lower}
+{eye_shadow_lower_color}
+  Eye Shadow (Upper): {eye_shadow_upper}
+{eye_shadow_upper_color}
+  Lip Stick:     {lip_stick}
+{lip_stick_color}
+TATTOO/MARK:
+  Horizontal Position: {tattoo_mark_position_horizontal}
+  Vertical Position:   {tattoo_mark_position_vertical}
+  Angle:               {tattoo_mark_angle}
+  Expansion:           {tattoo_mark_expansion}
+  Color:               RGB({tattoo_mark_color_r}, {tattoo_mark_color_g}, {tattoo_mark_color_b})
+  Flip:                {tattoo_mark_flip}
+
+BODY HAIR:
+  Intensity: {body_hair}
+{body_hair_color}
+============================================================
+"""
+
 
 @dataclass
 class CSMenuSystemSaveLoad:
@@ -1117,23 +976,19 @@ class CSMenuSystemSaveLoad:
     def read(cls, f: BytesIO) -> CSMenuSystemSaveLoad:
         """Read CSMenuSystemSaveLoad from stream (0x1800 bytes)"""
         obj = cls()
+        data = f.read(0x1800)
         
         # Header (8 bytes)
-        obj.unk0x0 = struct.unpack("<H", f.read(2))[0]
-        obj.unk0x2 = struct.unpack("<H", f.read(2))[0]
-        obj.size = struct.unpack("<I", f.read(4))[0]
+        obj.unk0x0, obj.unk0x2, obj.size = struct.unpack_from("<HHI", data)
         
-        # Read 15 presets
-        obj.presets = []
-        for _ in range(15):
-            preset = FacePreset.read(f)
-            obj.presets.append(preset)
+        # 15 presets, decoded straight out of the block
+        obj.presets = [
+            FacePreset.from_bytes(data, 8 + i * FACE_PRESET_SIZE)
+            for i in range(15)
+        ]
         
-        # Read remaining padding
-        bytes_read = 8 + (15 * 0x130)
-        remaining = 0x1800 - bytes_read
-        if remaining > 0:
-            obj.padding = f.read(remaining)
+        # Remaining padding
+        obj.padding = data[8 + 15 * FACE_PRESET_SIZE:]
         
         return obj
     
@@ -7,12 +7,77 @@ Based on ER-Save-Lib Rust implementation.
 
 from __future__ import annotations
 
+import mmap
+import os
+import stat
 from dataclasses import dataclass, field
 from io import BytesIO
 
 from .user_data_10 import UserData10
 from .user_data_x import UserDataX
 
+# Size of each os.write() in Save.save_atomic
+WRITE_CHUNK_SIZE = 1024 * 1024
+
+# File layout: each character slot, and USER_DATA_10 after them, is preceded
+# by an MD5 checksum on PC; PlayStation saves have no checksums
+PS_MAGIC = bytes([0xCB, 0x01, 0x9C, 0x2C])
+SLOT_SIZE = 0x280000
+CHECKSUM_SIZE = 0x10
+USER_DATA_10_SIZE = 0x60000
+
+# CSMenuSystemSaveLoad within USER_DATA_10, after Version (4) + SteamID (8)
+# + Settings (0x140); 8 byte header, then 15 presets of 0x130 bytes
+PRESETS_OFFSET = 4 + 8 + 0x140
+PRESETS_SIZE = 0x1800
+
+
+def _userdata10_offset(magic: bytes) -> int:
+    """Offset of USER_DATA_10's data (past its checksum on PC) for a save's magic"""
+    if magic in (b"BND4", b"SL2\x00"):
+        return 4 + 0x2FC + 10 * (CHECKSUM_SIZE + SLOT_SIZE) + CHECKSUM_SIZE
+    if magic == PS_MAGIC:
+        return 4 + 0x6C + 10 * SLOT_SIZE
+    raise ValueError(f"Invalid save file magic: {magic.hex()}")
+
+
+def _copy_file_attributes(src, dst) -> None:
+    """
+    Give dst the permission bits of src, plus its hidden and system
+    attributes on Windows, so a file swapped in for src keeps its access
+    """
+    try:
+        st = os.stat(src)
+    except FileNotFoundError:
+        return  # Nothing to replace yet: keep the default mode
+    attributes = getattr(st, "st_file_attributes", 0) & (
+        stat.FILE_ATTRIBUTE_HIDDEN | stat.FILE_ATTRIBUTE_SYSTEM
+    )
+    if attributes:
+        # Before chmod(), which only flips the read-only attribute
+        import ctypes
+        ctypes.windll.kernel32.SetFileAttributesW(str(dst), attributes)
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+
+def _keep_as_backup(filepath, backup_path) -> bool:
+    """
+    Make backup_path name the current file at filepath without copying it
+
+    Hard-links it where possible, so filepath stays in place until it is
+    replaced; otherwise renames it. Returns True if it was renamed.
+    """
+    try:
+        os.remove(backup_path)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(filepath, backup_path)
+        return False
+    except OSError:
+        os.replace(filepath, backup_path)
+        return True
+
 
 @dataclass
 class Save:
@@ -60,14 +125,40 @@ class Save:
             Save instance with all data parsed
         """
 
+        # Parse straight from the page cache; the only copy made is the
+        # mutable _raw_data buffer. The mapping is closed before returning so
+        # the file can be rewritten (Windows refuses while it is mapped).
         with open(filepath, "rb") as file:
-            data = file.read()
+            # The whole file is about to be read front to back: start the
+            # readahead now rather than on the first page faults
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return cls.from_bytes(mm, filepath)
 
-        f = BytesIO(data)
+    @classmethod
+    def from_bytes(cls, data, filepath: str | None = None) -> Save:
+        """
+        Parse a save file already in memory.
+
+        Args:
+            data: Save file contents (bytes, bytearray or a read-only mmap)
+            filepath: Path save() writes back to when called without one
+
+        Returns:
+            Save instance with all data parsed
+        """
+        # An mmap is its own file-like stream; anything else gets a BytesIO
+        f = data if isinstance(data, mmap.mmap) else BytesIO(data)
         obj = cls()
 
         # Track original filepath for save() method
-        obj._original_filepath = filepath
+        if filepath is not None:
+            obj._original_filepath = filepath
         obj._raw_data = bytearray(data)  # Keep raw data for modifications
 
         # Read magic (4 bytes)
@@ -176,6 +267,43 @@ class Save:
 
         return obj
 
+    @classmethod
+    def read_character_presets(cls, filepath: str):
+        """
+        Read only the character presets of a save file, without parsing it.
+
+        USER_DATA_10 sits at a fixed offset after the 10 character slots, so
+        the preset block is unpacked straight from a read-only mapping and
+        the ~28MB of character data is never touched.
+
+        Args:
+            filepath: Path to .sl2 or .co2 save file
+
+        Returns:
+            CSMenuSystemSaveLoad with all 15 presets, or None if the
+            character_presets module is not available
+        """
+        # The preset classes live in the app's character_presets module;
+        # without it the presets can't be decoded, as in MenuSystemSaveLoad
+        try:
+            from character_presets import CSMenuSystemSaveLoad
+        except ImportError:
+            return None
+
+        with open(filepath, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            # Only the first page and the preset block are touched: skip the
+            # readahead a sequential fault pattern would trigger
+            if hasattr(mmap, "MADV_RANDOM"):
+                mm.madvise(mmap.MADV_RANDOM)
+            offset = _userdata10_offset(mm[:4]) + PRESETS_OFFSET
+            block = mm[offset : offset + PRESETS_SIZE]
+
+        if len(block) < PRESETS_SIZE:
+            raise ValueError("Save file is truncated: character presets are missing")
+        return CSMenuSystemSaveLoad.read(BytesIO(block))
+
     def recalculate_checksums(self):
         """
         Recalculate MD5 checksums for all active slots
@@ -211,21 +339,7 @@ class Save:
             self._raw_data[checksum_offset : checksum_offset + CHECKSUM_SIZE] = md5_hash
 
         # Recalculate USER_DATA_10 checksum
-        HEADER_SIZE = 0x300 if self.magic == b"BND4" else 0x6C
-        SLOT_SIZE = 0x280000
-        CHECKSUM_SIZE = 0x10
-
-        userdata10_offset = HEADER_SIZE + (10 * (SLOT_SIZE + CHECKSUM_SIZE))
-        userdata10_checksum_offset = userdata10_offset
-        userdata10_data_offset = userdata10_offset + CHECKSUM_SIZE
-
-        userdata10_data = self._raw_data[
-            userdata10_data_offset : userdata10_data_offset + 0x60000
-        ]
-        md5_hash = hashlib.md5(userdata10_data).digest()
-        self._raw_data[
-            userdata10_checksum_offset : userdata10_checksum_offset + CHECKSUM_SIZE
-        ] = md5_hash
+        self._recalculate_userdata10_checksum()
 
     def to_file(self, filepath: str):
         """
@@ -318,6 +432,53 @@ class Save:
 
         self.to_file(filepath)
 
+    def save_atomic(self, filepath: str = None, backup_path: str = None):
+        """
+        Write the save through a temporary file and swap it into place.
+
+        The data goes to <filepath>.tmp in 1 MiB os.write() calls, is
+        fsynced, given the original's permissions, and then os.replace()s
+        the original, so a failed write leaves the existing save untouched.
+
+        With backup_path, the original file is kept there instead of being
+        copied: it is hard-linked to backup_path before the swap, or renamed
+        to it on filesystems without hard links (FAT, exFAT).
+
+        If no filepath provided, saves to the original file path
+        """
+        if filepath is None:
+            if not hasattr(self, "_original_filepath"):
+                raise ValueError("No filepath specified and original path not tracked")
+            filepath = self._original_filepath
+        if not hasattr(self, "_raw_data"):
+            raise RuntimeError("Cannot write save file: raw data not available")
+
+        tmp_path = f"{filepath}.tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_path, flags, 0o666)
+        renamed = False
+        try:
+            try:
+                view = memoryview(self._raw_data)
+                while view:
+                    written = os.write(fd, view[:WRITE_CHUNK_SIZE])
+                    view = view[written:]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            _copy_file_attributes(filepath, tmp_path)
+            if backup_path is not None:
+                renamed = _keep_as_backup(filepath, backup_path)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if renamed:
+                os.replace(backup_path, filepath)  # Put the original back
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
     @property
     def data(self):
         """Compatibility alias for _raw_data"""
@@ -518,8 +679,6 @@ class Save:
 
     def export_presets(self, output_path: str) -> int:
         """Export all active presets to JSON file"""
-        import json
-        
         presets = self.get_character_presets()
         if not presets:
             return 0
@@ -537,8 +696,18 @@ class Save:
             ]
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Encode the whole document in memory (with orjson's C encoder when
+        # it is installed) and hand it to the OS in one write
+        try:
+            import orjson
+        except ImportError:
+            import json
+            payload = json.dumps(data, indent=2).encode()
+        else:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        
+        with open(output_path, 'wb') as f:
+            f.write(payload)
         
         return len(active)
     
@@ -600,7 +769,20 @@ class Save:
 
     def copy_preset_to_save(self, source_save, source_slot: int, dest_slot: int) -> bool:
         """Copy preset from another save file"""
-        source_presets = source_save.get_character_presets()
+        return self.copy_preset_from(source_save.get_character_presets(), source_slot, dest_slot)
+
+    def copy_preset_from(self, source_presets, source_slot: int, dest_slot: int) -> bool:
+        """
+        Copy a preset out of a preset container into this save
+
+        Args:
+            source_presets: CSMenuSystemSaveLoad, e.g. from read_character_presets()
+            source_slot: Slot in source_presets (0-14)
+            dest_slot: Destination slot in this save (0-14)
+
+        Returns:
+            True if successful
+        """
         dest_presets = self.get_character_presets()
         
         if not source_presets or not dest_presets:
@@ -613,64 +795,67 @@ class Save:
         if source_preset.is_empty():
             return False
         
-        # Deep copy the preset
-        from io import BytesIO
-        preset_bytes = BytesIO()
-        source_preset.write(preset_bytes)
-        preset_bytes.seek(0)
-        
+        # Encode the preset once: the bytes are patched into the raw data and
+        # decoded again as this save's own copy of the preset
         from character_presets import FacePreset
-        dest_presets.presets[dest_slot] = FacePreset.read(preset_bytes)
+        preset_data = source_preset.to_bytes()
+        dest_presets.presets[dest_slot] = FacePreset.from_bytes(preset_data)
         
         # Update in raw data
-        self._update_preset_in_raw_data(dest_slot, dest_presets.presets[dest_slot])
+        self._patch_preset_bytes(dest_slot, preset_data)
         return True
 
+    def snapshot_presets(self):
+        """
+        Capture the presets and their raw bytes, for restore_presets()
+
+        A preset edit only changes USER_DATA_10 (and its checksum), so that
+        region and the parsed preset list are all that is kept.
+        """
+        start, end = self._userdata10_span()
+        presets = self.get_character_presets()
+        return (list(presets.presets) if presets else None, bytes(self._raw_data[start:end]))
+
+    def restore_presets(self, snapshot) -> None:
+        """Undo every preset change made since snapshot_presets()"""
+        preset_list, raw = snapshot
+        start, end = self._userdata10_span()
+        self._raw_data[start:end] = raw
+        if preset_list is not None:
+            self.get_character_presets().presets[:] = preset_list
+
+    def _userdata10_span(self) -> tuple[int, int]:
+        """(start, end) of USER_DATA_10 in the raw data, including its checksum on PC"""
+        data_offset = _userdata10_offset(self.magic)
+        start = data_offset if self.magic == PS_MAGIC else data_offset - CHECKSUM_SIZE
+        return start, data_offset + USER_DATA_10_SIZE
+
     def _update_preset_in_raw_data(self, slot_idx: int, preset) -> None:
         """Update preset in raw save data"""
-        from io import BytesIO
-    
-        # Calculate offset in save file
-        HEADER_SIZE = 0x300 if self.magic == b"BND4" else 0x6C
-        SLOT_SIZE = 0x280000
-        CHECKSUM_SIZE = 0x10
-        
-        # USER_DATA_10 offset
-        userdata10_start = HEADER_SIZE + (10 * (SLOT_SIZE + CHECKSUM_SIZE)) + CHECKSUM_SIZE
-        
-        # MenuSystemSaveLoad offset within USER_DATA_10
-        # Version(4) + SteamID(8) + Settings(0x140)
-        menu_offset = userdata10_start + 4 + 8 + 0x140
-        
+        self._patch_preset_bytes(slot_idx, preset.to_bytes())
+
+    def _patch_preset_bytes(self, slot_idx: int, preset_data: bytes) -> None:
+        """Write one encoded preset into the raw save data"""
         # CSMenuSystemSaveLoad header is 8 bytes, each preset is 0x130
-        preset_offset = menu_offset + 8 + (slot_idx * 0x130)
-        
-        # Write preset data
-        preset_stream = BytesIO()
-        preset.write(preset_stream)
-        preset_data = preset_stream.getvalue()
-        
+        preset_offset = _userdata10_offset(self.magic) + PRESETS_OFFSET + 8 + slot_idx * 0x130
         self._raw_data[preset_offset:preset_offset + len(preset_data)] = preset_data
         
-        # Recalculate USER_DATA_10 checksum
+        # Recalculate USER_DATA_10 checksum; the 10 character slots are unchanged
         self._recalculate_userdata10_checksum()
 
     def _recalculate_userdata10_checksum(self) -> None:
-        """Recalculate USER_DATA_10 MD5 checksum after preset modification"""
+        """Recalculate USER_DATA_10 MD5 checksum after preset modification (PC only)"""
+        if self.magic == PS_MAGIC:
+            return  # PlayStation saves carry no checksums
         import hashlib
         
-        HEADER_SIZE = 0x300 if self.magic == b"BND4" else 0x6C
-        SLOT_SIZE = 0x280000
-        CHECKSUM_SIZE = 0x10
+        data_offset = _userdata10_offset(self.magic)
         
-        userdata10_offset = HEADER_SIZE + (10 * (SLOT_SIZE + CHECKSUM_SIZE))
-        userdata10_checksum_offset = userdata10_offset
-        userdata10_data_offset = userdata10_offset + CHECKSUM_SIZE
-        
-        userdata10_data = self._raw_data[userdata10_data_offset:userdata10_data_offset + 0x60000]
+        # Hash through a memoryview so the 0x60000 bytes are not copied first
+        userdata10_data = memoryview(self._raw_data)[data_offset:data_offset + USER_DATA_10_SIZE]
         md5_hash = hashlib.md5(userdata10_data).digest()
-        self._raw_data[userdata10_checksum_offset:userdata10_checksum_offset + CHECKSUM_SIZE] = md5_hash
-
+        userdata10_data.release()
+        self._raw_data[data_offset - CHECKSUM_SIZE:data_offset] = md5_hash
 
 def load_save(filepath: str) -> Save:
     """
@@ -0,0 +1,218 @@
+"""
+Elden Ring Character Preset Manager - Controller
+
+Save file and preset state behind the GUI. Nothing here touches Tk, so the
+slow methods (parsing, writing, copying) can run on a worker thread while
+the view only updates widgets with the results.
+"""
+
+import os
+from pathlib import Path
+
+# The save parser is imported where it is first used, so Tk can draw the
+# window before the parser modules load
+
+# Number of parsed saves kept for reloads of unchanged files
+SAVE_CACHE_SIZE = 4
+
+
+def find_saves(root):
+    """Walk a directory tree once and return every ER*.sl2 / ER*.co2 file"""
+    found = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.startswith("ER") and entry.name.endswith((".sl2", ".co2")):
+                        found.append(Path(entry.path))
+        except OSError:
+            continue  # Unreadable folder, skip it like rglob does
+    return sorted(found)
+
+
+def read_preset_summaries(json_path):
+    """
+    Read (slot, body_type) for each preset in an exported JSON file
+
+    Streams the file with ijson when it is installed so the ~200 values of
+    every preset are never materialized; falls back to json.load otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        import json
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        return [
+            (entry.get('slot', i), entry.get('data', {}).get('body_type', 0))
+            for i, entry in enumerate(data.get('presets', []))
+        ]
+
+    summaries = []
+    with open(json_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "presets.item" and event == "start_map":
+                summaries.append([len(summaries), 0])
+            elif prefix == "presets.item.slot":
+                summaries[-1][0] = value
+            elif prefix == "presets.item.data.body_type":
+                summaries[-1][1] = value
+    return [tuple(summary) for summary in summaries]
+
+
+class PresetController:
+    """
+    The loaded save, its presets, and every operation on them
+
+    read_save(), save() and copy_preset_to() do file I/O and are meant for a
+    worker thread; the rest only touch memory and are cheap enough to call
+    from the UI thread. A single worker keeps the writes ordered.
+    """
+
+    def __init__(self):
+        self.save_obj = None
+        self.save_path = None
+        self.presets = None
+        self._active_presets = None  # Memoized presets.get_active_presets()
+        self._unsaved_snapshot = None  # save_obj.snapshot_presets() before an unsaved import
+
+        # Parsed saves keyed by (path, mtime_ns, size), oldest first
+        self._save_cache = {}
+
+    @staticmethod
+    def cache_key(filepath, st):
+        """Cache key for a save file and its os.stat() result"""
+        return (filepath, st.st_mtime_ns, st.st_size)
+
+    def cached_save(self, cache_key):
+        """Previously parsed save for an unchanged file, or None"""
+        return self._save_cache.get(cache_key)
+
+    def read_save(self, cache_key):
+        """Parse the save named by cache_key and remember it (worker thread)"""
+        from elden_ring_save_parser_lib.save import Save
+
+        save = Save.from_file(cache_key[0])
+        self._store(cache_key, save)
+        return save
+
+    def _store(self, cache_key, save):
+        """Add a parsed save to the cache, evicting the oldest entry if full"""
+        self._save_cache[cache_key] = save
+        if len(self._save_cache) > SAVE_CACHE_SIZE:
+            del self._save_cache[next(iter(self._save_cache))]
+
+    def _load_save(self, filepath):
+        """Parsed save for filepath, reused while its mtime and size are unchanged"""
+        key = self.cache_key(filepath, os.stat(filepath))
+        save = self.cached_save(key)
+        if save is None:
+            save = self.read_save(key)
+        return save
+
+    def _write_save(self, save, filepath, backup_path):
+        """
+        Back up filepath, write save over it, and cache save under the new stat()
+
+        The written file is byte-for-byte save's raw data, so a later load of
+        it can reuse the object instead of parsing the file again.
+        """
+        self.invalidate(filepath)
+        save.save_atomic(filepath, backup_path)
+        self._store(self.cache_key(filepath, os.stat(filepath)), save)
+
+    def open_save(self, save, filepath):
+        """Make a parsed save current; returns its presets or None"""
+        self.save_obj = save
+        self.save_path = filepath
+        self.presets = save.get_character_presets()
+        self._active_presets = None
+        self._unsaved_snapshot = None
+        return self.presets
+
+    def is_loaded(self, filepath):
+        """True if filepath names the currently loaded save"""
+        if self.save_path is None:
+            return False
+        try:
+            return os.path.samefile(filepath, self.save_path)
+        except OSError:
+            return False  # Either file is missing, so they can't be the same
+
+    def load(self, filepath):
+        """Parse (or reuse) a save file and make it current; returns its presets"""
+        return self.open_save(self._load_save(filepath), filepath)
+
+    def active_presets(self):
+        """Active (slot, preset) pairs, computed once per load or import"""
+        if self._active_presets is None:
+            self._active_presets = self.presets.get_active_presets() if self.presets else []
+        return self._active_presets
+
+    def export(self, output_path):
+        """Export the active presets to JSON; returns the number written"""
+        return self.save_obj.export_presets(output_path)
+
+    def import_preset(self, json_path, preset_idx, dest_idx):
+        """Import one preset from an exported JSON file into the loaded save (in memory)"""
+        # Kept until save() has written the import, which undoes it on failure
+        if self._unsaved_snapshot is None:
+            self._unsaved_snapshot = self.save_obj.snapshot_presets()
+        success = self.save_obj.import_preset_from_json(json_path, preset_idx, dest_idx)
+        if success:
+            self._active_presets = None
+        return success
+
+    def invalidate(self, filepath):
+        """Drop every cached parse of a file that is about to change"""
+        for key in [key for key in self._save_cache if key[0] == filepath]:
+            del self._save_cache[key]
+
+    def save(self, backup_path):
+        """
+        Back up the loaded save file and write the modified save over it (worker thread)
+
+        If the write fails, imports made since the last save are undone in
+        memory too, so a later write can't put them on disk.
+        """
+        snapshot, self._unsaved_snapshot = self._unsaved_snapshot, None
+        try:
+            self._write_save(self.save_obj, self.save_path, backup_path)
+        except BaseException:
+            if snapshot is not None:
+                self.save_obj.restore_presets(snapshot)
+                self._active_presets = None
+            raise
+
+    def copy_preset_to(self, dest_path, source_idx, dest_idx, backup_path):
+        """
+        Copy a preset of the loaded save into another save file (worker thread)
+
+        The destination is backed up before it is rewritten. Returns False,
+        leaving the file untouched, if the preset could not be copied.
+        """
+        # Copying within the loaded save patches it in place; keep what the
+        # copy replaces so a failed write can't leave it in memory
+        if self.is_loaded(dest_path):
+            dest_save = self.save_obj
+            snapshot = dest_save.snapshot_presets()
+        else:
+            dest_save = self._load_save(dest_path)
+            snapshot = None
+        if not dest_save.copy_preset_to_save(self.save_obj, source_idx, dest_idx):
+            return False
+
+        # _write_save() drops the file's cached parses first, so a failed
+        # write never leaves a patched copy in the cache either
+        try:
+            self._write_save(dest_save, dest_path, backup_path)
+        except BaseException:
+            if snapshot is not None:
+                dest_save.restore_presets(snapshot)
+            raise
+        if snapshot is not None:
+            self._active_presets = None
+        return True
@@ -5,18 +5,77 @@ Elden Ring Character Preset Manager - GUI
 Graphical interface for managing character appearance presets across save files.
 """
 
+import bisect
 import os
-import shutil
+import re
 import sys
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from tkinter import filedialog, messagebox, ttk
+from tkinter import ttk
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from elden_ring_save_parser_lib.save import Save
-from character_presets import CSMenuSystemSaveLoad, FacePreset
+from preset_controller import PresetController, find_saves, read_preset_summaries
+
+# Tracebacks go to the console only when PRESET_TOOL_DEBUG is set; users
+# get the message box either way
+DEBUG = bool(os.environ.get("PRESET_TOOL_DEBUG"))
+
+# Status bar spinner frames shown while a save is parsed in the background
+SPINNER_FRAMES = "|/-\\"
+
+# Seconds a stat() of the selected save is trusted before load re-checks it
+STAT_MAX_AGE = 1.0
+
+# One preset list row; FacePreset's fixed-width RGB strings keep the columns aligned
+LINE_FMT = (
+    "Slot {s:2d} | {bt:6s} | Face:{fm:2d} Hair:{hm:2d} | "
+    "Skin:{skin} Hair:{hair}"
+)
+
+# List column label for each body type byte; anything else shows as Type B
+BODY_TYPE_LABELS = ("Type A", "Type B")
+
+
+def _grid_form(frame, rows, first_row=1):
+    """
+    Lay out a dialog's (label text, input widget, extra grid options) rows
+    
+    Labels go in column 0 and inputs in column 1, starting below the
+    dialog heading on row 0.
+    """
+    for row, (text, widget, options) in enumerate(rows, first_row):
+        ttk.Label(frame, text=text).grid(row=row, column=0, sticky=tk.W, pady=5)
+        widget.grid(row=row, column=1, padx=5, **options)
+
+
+def _set_dialog_busy(dialog, busy, buttons):
+    """
+    Lock a dialog while its save is written on the worker thread
+    
+    Its buttons are disabled and the window's close button does nothing, so
+    the dialog (and its grab) stays up until the result has been reported.
+    """
+    state = tk.DISABLED if busy else tk.NORMAL
+    for button in buttons:
+        button.config(state=state)
+    dialog.protocol("WM_DELETE_WINDOW", (lambda: None) if busy else dialog.destroy)
+
+
+def _preset_row(slot, preset, fmt=LINE_FMT.format):
+    """The preset list row for a slot (0-based)"""
+    return fmt(
+        s=slot + 1,
+        bt=BODY_TYPE_LABELS[preset.get_body_type() != 0],
+        fm=preset.face_model,
+        hm=preset.hair_model,
+        skin=preset.skin_rgb_str,
+        hair=preset.hair_rgb_str,
+    )
 
 
 class PresetManagerGUI:
@@ -39,13 +98,45 @@ class PresetManagerGUI:
         )
         
         self.default_save_path = Path(os.environ.get("APPDATA", "")) / "EldenRing"
-        self.current_save = None
-        self.current_save_path = None
-        self.presets = None
+        self.controller = PresetController()
+        self._current_path = None  # Path of the selected file
+        self._current_stat = None  # (os.stat_result, time.monotonic()) or None
         self.selected_slot = None
+        self._row_slots = []  # Slot index shown on each preset list row
+        
+        # Single worker so controller I/O never overlaps; Tk stays on the main thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
         
         self.setup_ui()
         
+    # The dialog modules are only needed once the user does something, so
+    # they are imported on first use rather than at startup
+    
+    @cached_property
+    def messagebox(self):
+        """tkinter.messagebox, imported on first use"""
+        from tkinter import messagebox
+        return messagebox
+    
+    @cached_property
+    def filedialog(self):
+        """tkinter.filedialog, imported on first use"""
+        from tkinter import filedialog
+        return filedialog
+    
+    @cached_property
+    def detail_sections(self):
+        """
+        PRESET_DETAIL_TEMPLATE split at its section header lines ("MODELS:", ...),
+        so the header offsets are known while the text is built:
+        (preamble, ((header, body), ...))
+        
+        Built on first use, as character_presets is not needed at startup.
+        """
+        from character_presets import PRESET_DETAIL_TEMPLATE
+        parts = re.split(r"^([A-Z][A-Z /]*:)$", PRESET_DETAIL_TEMPLATE, flags=re.MULTILINE)
+        return parts[0], tuple(zip(parts[1::2], parts[2::2], strict=True))
+        
     def setup_ui(self):
         """Setup the UI components"""
         # Title
@@ -98,13 +189,14 @@ class PresetManagerGUI:
         buttons_frame = ttk.Frame(file_frame)
         buttons_frame.pack(fill=tk.X, pady=(10, 0))
         
-        ttk.Button(
+        self.load_button = ttk.Button(
             buttons_frame,
             text="Load Presets",
             command=self.load_presets,
             width=20,
             style="Accent.TButton",
-        ).pack(side=tk.LEFT)
+        )
+        self.load_button.pack(side=tk.LEFT)
         
         # Preset Selection
         preset_frame = ttk.LabelFrame(
@@ -119,8 +211,11 @@ class PresetManagerGUI:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Rows live in a Tcl list variable so a refill is a single set()
+        self._preset_var = tk.StringVar()
         self.preset_listbox = tk.Listbox(
             list_frame,
+            listvariable=self._preset_var,
             yscrollcommand=scrollbar.set,
             font=("Consolas", 10),
             height=12,
@@ -185,51 +280,90 @@ class PresetManagerGUI:
         
     def browse_file(self):
         """Open file browser"""
-        filename = filedialog.askopenfilename(
+        filename = self.filedialog.askopenfilename(
             title="Select Elden Ring Save File",
             initialdir=self.default_save_path,
             filetypes=[("Elden Ring Saves", "*.sl2 *.co2"), ("All files", "*.*")],
         )
         if filename:
-            self.file_path_var.set(filename)
-            self.status_var.set(f"Selected: {os.path.basename(filename)}")
+            self._select_path(filename)
+            self.status_var.set(f"Selected: {self._current_path.name}")
+            
+    def _select_path(self, filename):
+        """Make filename the selected save and remember its stat() result"""
+        self.file_path_var.set(filename)
+        self._current_stat = None
+        self._stat_selected(filename)
+            
+    def _stat_selected(self, filepath):
+        """stat() the selected save, reusing a fresh result; None if missing"""
+        if (
+            self._current_stat is not None
+            and str(self._current_path) == str(Path(filepath))
+            and time.monotonic() - self._current_stat[1] < STAT_MAX_AGE
+        ):
+            return self._current_stat[0]
+        
+        self._current_path = Path(filepath)
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            self._current_stat = None
+            return None
+        self._current_stat = (st, time.monotonic())
+        return st
+            
+    def _center_window(self, window, width, height):
+        """Size a Toplevel and center it on screen with a single geometry call"""
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
+        window.geometry(f"{width}x{height}+{x}+{y}")
             
     def auto_detect(self):
         """Auto-detect save file"""
         if not self.default_save_path.exists():
-            messagebox.showerror(
+            self.messagebox.showerror(
                 "Not Found",
                 f"Elden Ring save folder not found:\n{self.default_save_path}",
             )
             return
         
-        saves = list(self.default_save_path.rglob("ER*.sl2")) + list(
-            self.default_save_path.rglob("ER*.co2")
-        )
+        self.status_var.set("Searching for save files...")
+        future = self._executor.submit(find_saves, self.default_save_path)
+        self.root.after(50, self._poll_auto_detect, future)
+        
+    def _poll_auto_detect(self, future):
+        """Wait for the background save search, then offer the results"""
+        if not future.done():
+            self.root.after(50, self._poll_auto_detect, future)
+            return
+        
+        try:
+            saves = future.result()
+        except Exception as e:
+            self.messagebox.showerror("Error", f"Failed to search for save files:\n{str(e)}")
+            self.status_var.set("Error")
+            return
         
         if not saves:
-            messagebox.showwarning("Not Found", "No Elden Ring save files found.")
+            self.messagebox.showwarning("Not Found", "No Elden Ring save files found.")
+            self.status_var.set("No save files found")
             return
         
         if len(saves) == 1:
-            self.file_path_var.set(str(saves[0]))
+            self._select_path(str(saves[0]))
             self.status_var.set("Save file auto-detected")
         else:
+            self.status_var.set(f"Found {len(saves)} save files")
             self.show_save_selector(saves)
             
     def show_save_selector(self, saves):
         """Show dialog to select from multiple saves"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Select Save File")
-        dialog.geometry("500x300")
+        self._center_window(dialog, 500, 300)
         dialog.grab_set()
         
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"500x300+{x}+{y}")
-        
         ttk.Label(
             dialog,
             text=f"Found {len(saves)} save files:",
@@ -243,77 +377,149 @@ class PresetManagerGUI:
         scrollbar = ttk.Scrollbar(listbox_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        listbox = tk.Listbox(
-            listbox_frame, yscrollcommand=scrollbar.set, font=("Consolas", 9)
+        # Fixed-width column: long Steam paths don't trigger a re-measure per row
+        tree = ttk.Treeview(
+            listbox_frame,
+            columns=("path",),
+            show="headings",
+            selectmode="browse",
+            yscrollcommand=scrollbar.set,
         )
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=listbox.yview)
+        tree.heading("path", text="Save File", anchor=tk.W)
+        tree.column("path", width=460, stretch=False, anchor=tk.W)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=tree.yview)
         
-        for save in saves:
-            listbox.insert(tk.END, str(save))
+        for i, save in enumerate(saves):
+            tree.insert("", tk.END, iid=str(i), values=(str(save),))
         
         def select_save():
-            selection = listbox.curselection()
+            selection = tree.selection()
             if selection:
-                self.file_path_var.set(str(saves[selection[0]]))
-                self.status_var.set(f"Selected: {saves[selection[0]].name}")
+                save = saves[int(selection[0])]
+                self._select_path(str(save))
+                self.status_var.set(f"Selected: {save.name}")
                 dialog.destroy()
         
         ttk.Button(
             dialog, text="Select", command=select_save, style="Accent.TButton"
         ).pack(pady=10)
-        listbox.bind("<Double-Button-1>", lambda e: select_save())
+        tree.bind("<Double-Button-1>", lambda e: select_save())
         
     def load_presets(self):
         """Load the selected save file"""
         filepath = self.file_path_var.get()
+        st = self._stat_selected(filepath) if filepath else None
+        
+        if st is None:
+            self.messagebox.showerror("Error", "Please select a valid save file first!")
+            return
+        
+        name = self._current_path.name
+        cache_key = self.controller.cache_key(filepath, st)
+        cached = self.controller.cached_save(cache_key)
+        if cached is not None:
+            self._show_loaded_save(cached, filepath, name)
+            return
+        
+        self.load_button.config(state=tk.DISABLED)
+        self.status_var.set(f"Loading {name}...")
+        self.root.update_idletasks()
         
-        if not filepath or not os.path.exists(filepath):
-            messagebox.showerror("Error", "Please select a valid save file first!")
+        # Parse off the Tk thread and poll for completion
+        future = self._executor.submit(self.controller.read_save, cache_key)
+        self.root.after(50, self._poll_load, future, cache_key, name)
+        
+    def _poll_load(self, future, cache_key, name, tick=0):
+        """Wait for a background load to finish, then update the UI"""
+        if not future.done():
+            frame = SPINNER_FRAMES[tick % len(SPINNER_FRAMES)]
+            self.status_var.set(f"Loading {name}... {frame}")
+            self.root.after(50, self._poll_load, future, cache_key, name, tick + 1)
             return
         
+        self.load_button.config(state=tk.NORMAL)
+        
         try:
-            self.status_var.set(f"Loading {os.path.basename(filepath)}...")
-            self.root.update()
-            
-            self.current_save = Save.from_file(filepath)
-            self.current_save_path = filepath
-            self.presets = self.current_save.get_character_presets()
-            
-            if not self.presets:
-                messagebox.showerror("Error", "Could not load character presets from this save file.")
-                self.status_var.set("Error loading presets")
-                return
-            
-            self.populate_preset_list()
-            self.status_var.set(f"Loaded: {os.path.basename(filepath)}")
-            
+            save = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load save file:\n{str(e)}")
+            self.messagebox.showerror("Error", f"Failed to load save file:\n{str(e)}")
             self.status_var.set("Error")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                import traceback
+                traceback.print_exc()
+            return
+        
+        self._show_loaded_save(save, cache_key[0], name)
+        
+    def _show_loaded_save(self, save, filepath, name):
+        """Make a parsed save current and list its presets"""
+        if not self.controller.open_save(save, filepath):
+            self.messagebox.showerror("Error", "Could not load character presets from this save file.")
+            self.status_var.set("Error loading presets")
+            return
+        
+        self.populate_preset_list()
+        self.status_var.set(f"Loaded: {name}")
+        
+    def _when_done(self, future, callback):
+        """Call callback(future) on the Tk thread once the future has finished"""
+        if future.done():
+            callback(future)
+        else:
+            self.root.after(50, self._when_done, future, callback)
             
     def populate_preset_list(self):
         """Populate the preset list"""
-        self.preset_listbox.delete(0, tk.END)
-        
-        if not self.presets:
+        # Unmap the listbox while refilling it so Tk lays out and paints it
+        # once, the Tk counterpart of WM_SETREDRAW(FALSE) on a Win32 list
+        self.preset_listbox.pack_forget()
+        try:
+            self._fill_preset_list()
+        finally:
+            self.preset_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            
+    def _fill_preset_list(self):
+        """Replace the preset list rows"""
+        self._row_slots = []
+        if not self.controller.presets:
+            self._preset_var.set(())
             return
         
-        active_presets = self.presets.get_active_presets()
+        active_presets = self.controller.active_presets()
         
         if not active_presets:
-            self.preset_listbox.insert(tk.END, "No presets found in this save file")
+            self._preset_var.set(("No presets found in this save file",))
             return
         
-        for slot, preset in active_presets:
-            body_type = "Type A" if preset.get_body_type() == 0 else "Type B"
-            skin = f"RGB({preset.skin_color_r},{preset.skin_color_g},{preset.skin_color_b})"
-            hair = f"RGB({preset.hair_color_r},{preset.hair_color_g},{preset.hair_color_b})"
-            
-            line = f"Slot {slot + 1:2d} | {body_type:6s} | Face:{preset.face_model:2d} Hair:{preset.hair_model:2d} | Skin:{skin:15s} Hair:{hair}"
-            self.preset_listbox.insert(tk.END, line)
+        # At most 15 rows, so a plain loop with the bound format method beats
+        # converting the columns to arrays first
+        self._row_slots = [slot for slot, _ in active_presets]
+        self._preset_var.set(tuple(
+            _preset_row(slot, preset) for slot, preset in active_presets
+        ))
+        
+    def update_preset_row(self, slot_idx):
+        """Redraw the row of one slot that changed, leaving the others alone"""
+        rows = self._row_slots
+        if not rows:
+            # Empty list or the "No presets" placeholder: nothing to patch
+            self.populate_preset_list()
+            return
+        
+        preset = self.controller.presets.presets[slot_idx]
+        i = bisect.bisect_left(rows, slot_idx)
+        present = i < len(rows) and rows[i] == slot_idx
+        
+        if present:
+            self.preset_listbox.delete(i)
+            del rows[i]
+        if not preset.is_empty():
+            self.preset_listbox.insert(i, _preset_row(slot_idx, preset))
+            rows.insert(i, slot_idx)
+        
+        if not rows:
+            self.populate_preset_list()
             
     def on_preset_select(self, event):
         """Handle preset selection"""
@@ -322,17 +528,17 @@ class PresetManagerGUI:
             return
         
         # Get the actual slot number from active presets
-        active_presets = self.presets.get_active_presets()
+        active_presets = self.controller.active_presets()
         if selection[0] < len(active_presets):
             self.selected_slot = active_presets[selection[0]][0]
             
     def show_preset_details(self, event=None):
         """Show detailed preset information in a popup"""
         if self.selected_slot is None:
-            messagebox.showwarning("No Selection", "Please select a preset first!")
+            self.messagebox.showwarning("No Selection", "Please select a preset first!")
             return
         
-        preset = self.presets.presets[self.selected_slot]
+        preset = self.controller.presets.presets[self.selected_slot]
         
         if preset.is_empty():
             return
@@ -340,15 +546,9 @@ class PresetManagerGUI:
         # Create detail window
         detail_window = tk.Toplevel(self.root)
         detail_window.title(f"Preset Details - Slot {self.selected_slot + 1}")
-        detail_window.geometry("700x700")
+        self._center_window(detail_window, 700, 700)
         detail_window.grab_set()
         
-        # Center window
-        detail_window.update_idletasks()
-        x = (detail_window.winfo_screenwidth() // 2) - (detail_window.winfo_width() // 2)
-        y = (detail_window.winfo_screenheight() // 2) - (detail_window.winfo_height() // 2)
-        detail_window.geometry(f"700x700+{x}+{y}")
-        
         # Create text widget with scrollbar
         text_frame = ttk.Frame(detail_window, padding=10)
         text_frame.pack(fill=tk.BOTH, expand=True)
@@ -367,204 +567,12 @@ class PresetManagerGUI:
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=text_widget.yview)
         
-        # Build complete details text
-        details = []
-        details.append(f"{'='*60}\n")
-        details.append(f"PRESET SLOT {self.selected_slot + 1}\n")
-        details.append(f"{'='*60}\n\n")
-        
-        body_type = "Type A (Male)" if preset.get_body_type() == 0 else "Type B (Female)"
-        details.append(f"Body Type: {body_type}\n\n")
-        
-        # MODELS
-        details.append("MODELS:\n")
-        details.append(f"  Face Model:    {preset.face_model}\n")
-        details.append(f"  Hair Model:    {preset.hair_model}\n")
-        details.append(f"  Eyebrow Model: {preset.eyebrow_model}\n")
-        details.append(f"  Beard Model:   {preset.beard_model}\n")
-        details.append(f"  Eye Patch:     {preset.eyepatch_model}\n\n")
-        
-        # FACIAL STRUCTURE - Complete
-        details.append("FACIAL STRUCTURE:\n")
-        details.append(f"  Apparent Age:      {preset.apparent_age}\n")
-        details.append(f"  Facial Aesthetic:  {preset.facial_aesthetic}\n")
-        details.append(f"  Form Emphasis:     {preset.form_emphasis}\n\n")
-        
-        details.append("  Brow Ridge:\n")
-        details.append(f"    Height: {preset.brow_ridge_height}\n")
-        details.append(f"    Inner:  {preset.inner_brow_ridge}\n")
-        details.append(f"    Outer:  {preset.outer_brow_ridge}\n\n")
-        
-        details.append("  Cheekbones:\n")
-        details.append(f"    Height:     {preset.cheekbone_height}\n")
-        details.append(f"    Depth:      {preset.cheekbone_depth}\n")
-        details.append(f"    Width:      {preset.cheekbone_width}\n")
-        details.append(f"    Protrusion: {preset.cheekbone_protrusion}\n")
-        details.append(f"  Cheeks: {preset.cheeks}\n\n")
-        
-        details.append("  Chin:\n")
-        details.append(f"    Tip Position: {preset.chin_tip_position}\n")
-        details.append(f"    Length:       {preset.chin_length}\n")
-        details.append(f"    Protrusion:   {preset.chin_protrusion}\n")
-        details.append(f"    Depth:        {preset.chin_depth}\n")
-        details.append(f"    Size:         {preset.chin_size}\n")
-        details.append(f"    Height:       {preset.chin_height}\n")
-        details.append(f"    Width:        {preset.chin_width}\n\n")
-        
-        details.append("  Eyes:\n")
-        details.append(f"    Position: {preset.eye_position}\n")
-        details.append(f"    Size:     {preset.eye_size}\n")
-        details.append(f"    Slant:    {preset.eye_slant}\n")
-        details.append(f"    Spacing:  {preset.eye_spacing}\n\n")
-        
-        details.append("  Nose:\n")
-        details.append(f"    Size:            {preset.nose_size}\n")
-        details.append(f"    Forehead Ratio:  {preset.nose_forehead_ratio}\n")
-        details.append(f"    Ridge Depth:     {preset.nose_ridge_depth}\n")
-        details.append(f"    Ridge Length:    {preset.nose_ridge_length}\n")
-        details.append(f"    Position:        {preset.nose_position}\n")
-        details.append(f"    Tip Height:      {preset.nose_tip_height}\n")
-        details.append(f"    Nostril Slant:   {preset.nostril_slant}\n")
-        details.append(f"    Nostril Size:    {preset.nostril_size}\n")
-        details.append(f"    Nostril Width:   {preset.nostril_width}\n")
-        details.append(f"    Protrusion:      {preset.nose_protrusion}\n")
-        details.append(f"    Bridge Height:   {preset.nose_bridge_height}\n")
-        details.append(f"    Bridge Prot. 1:  {preset.bridge_protrusion1}\n")
-        details.append(f"    Bridge Prot. 2:  {preset.bridge_protrusion2}\n")
-        details.append(f"    Bridge Width:    {preset.nose_bridge_width}\n")
-        details.append(f"    Height:          {preset.nose_height}\n")
-        details.append(f"    Slant:           {preset.nose_slant}\n\n")
-        
-        details.append("  Face Shape:\n")
-        details.append(f"    Protrusion:          {preset.face_protrusion}\n")
-        details.append(f"    Vertical Ratio:      {preset.vertical_face_ratio}\n")
-        details.append(f"    Feature Slant:       {preset.facial_feature_slant}\n")
-        details.append(f"    Horizontal Ratio:    {preset.horizontal_face_ratio}\n\n")
-        
-        details.append("  Forehead:\n")
-        details.append(f"    Depth:      {preset.forehead_depth}\n")
-        details.append(f"    Protrusion: {preset.forehead_protrusion}\n\n")
-        
-        details.append("  Jaw:\n")
-        details.append(f"    Protrusion: {preset.jaw_protrusion}\n")
-        details.append(f"    Width:      {preset.jaw_width}\n")
-        details.append(f"    Lower:      {preset.lower_jaw}\n")
-        details.append(f"    Contour:    {preset.jaw_contour}\n\n")
-        
-        details.append("  Lips:\n")
-        details.append(f"    Shape:      {preset.lip_shape}\n")
-        details.append(f"    Size:       {preset.lip_size}\n")
-        details.append(f"    Fullness:   {preset.lip_fullness}\n")
-        details.append(f"    Protrusion: {preset.lip_protrusion}\n")
-        details.append(f"    Thickness:  {preset.lip_thickness}\n\n")
-        
-        details.append("  Mouth:\n")
-        details.append(f"    Expression:     {preset.mouth_expression}\n")
-        details.append(f"    Protrusion:     {preset.mouth_protrusion}\n")
-        details.append(f"    Slant:          {preset.mouth_slant}\n")
-        details.append(f"    Occlusion:      {preset.occlusion}\n")
-        details.append(f"    Position:       {preset.mouth_position}\n")
-        details.append(f"    Width:          {preset.mouth_width}\n")
-        details.append(f"    Chin Distance:  {preset.mouth_chin_distance}\n\n")
-        
-        # BODY PROPORTIONS
-        details.append("BODY PROPORTIONS:\n")
-        details.append(f"  Head:    {preset.head_size}\n")
-        details.append(f"  Chest:   {preset.chest_size}\n")
-        details.append(f"  Abdomen: {preset.abdomen_size}\n")
-        details.append(f"  Arms:    {preset.arms_size}\n")
-        details.append(f"  Legs:    {preset.legs_size}\n\n")
-        
-        # COLORS - Complete with details
-        details.append("COLORS:\n")
-        details.append(f"  Skin:       RGB({preset.skin_color_r:3d}, {preset.skin_color_g:3d}, {preset.skin_color_b:3d})\n")
-        details.append(f"    Luster: {preset.skin_luster}\n")
-        details.append(f"    Pores:  {preset.pores}\n\n")
-        
-        details.append(f"  Hair:       RGB({preset.hair_color_r:3d}, {preset.hair_color_g:3d}, {preset.hair_color_b:3d})\n")
-        details.append(f"    Luster:        {preset.luster}\n")
-        details.append(f"    Root Darkness: {preset.hair_root_darkness}\n")
-        details.append(f"    White Hairs:   {preset.white_hairs}\n\n")
-        
-        details.append(f"  Beard:      RGB({preset.beard_color_r:3d}, {preset.beard_color_g:3d}, {preset.beard_color_b:3d})\n")
-        details.append(f"    Luster:        {preset.beard_luster}\n")
-        details.append(f"    Root Darkness: {preset.beard_root_darkness}\n")
-        details.append(f"    White Hairs:   {preset.beard_white_hairs}\n\n")
-        
-        details.append(f"  Eyebrows:   RGB({preset.brow_color_r:3d}, {preset.brow_color_g:3d}, {preset.brow_color_b:3d})\n")
-        details.append(f"    Luster:        {preset.brow_luster}\n")
-        details.append(f"    Root Darkness: {preset.brow_root_darkness}\n")
-        details.append(f"    White Hairs:   {preset.brow_white_hairs}\n\n")
-        
-        details.append(f"  Eyelashes:  RGB({preset.eye_lash_color_r:3d}, {preset.eye_lash_color_g:3d}, {preset.eye_lash_color_b:3d})\n")
-        details.append(f"  Eye Patch:  RGB({preset.eye_patch_color_r:3d}, {preset.eye_patch_color_g:3d}, {preset.eye_patch_color_b:3d})\n\n")
-        
-        details.append(f"  Left Eye:   RGB({preset.left_iris_color_r:3d}, {preset.left_iris_color_g:3d}, {preset.left_iris_color_b:3d})\n")
-        details.append(f"    Iris Size:  {preset.left_iris_size}\n")
-        details.append(f"    Clouding:   {preset.left_eye_clouding}\n")
-        details.append(f"    Cloud RGB:  ({preset.left_eye_clouding_color_r}, {preset.left_eye_clouding_color_g}, {preset.left_eye_clouding_color_b})\n")
-        details.append(f"    White RGB:  ({preset.left_eye_white_color_r}, {preset.left_eye_white_color_g}, {preset.left_eye_white_color_b})\n")
-        details.append(f"    Position:   {preset.left_eye_position}\n\n")
-        
-        details.append(f"  Right Eye:  RGB({preset.right_iris_color_r:3d}, {preset.right_iris_color_g:3d}, {preset.right_iris_color_b:3d})\n")
-        details.append(f"    Iris Size:  {preset.right_iris_size}\n")
-        details.append(f"    Clouding:   {preset.right_eye_clouding}\n")
-        details.append(f"    Cloud RGB:  ({preset.right_eye_clouding_color_r}, {preset.right_eye_clouding_color_g}, {preset.right_eye_clouding_color_b})\n")
-        details.append(f"    White RGB:  ({preset.right_eye_white_color_r}, {preset.right_eye_white_color_g}, {preset.right_eye_white_color_b})\n")
-        details.append(f"    Position:   {preset.right_eye_position}\n\n")
-        
-        # COSMETICS - Complete
-        details.append("COSMETICS:\n")
-        details.append(f"  Stubble:       {preset.stubble}\n\n")
-        
-        details.append(f"  Dark Circles:  {preset.dark_circles}\n")
-        if preset.dark_circles > 0:
-            details.append(f"    Color: RGB({preset.dark_circle_color_r}, {preset.dark_circle_color_g}, {preset.dark_circle_color_b})\n")
-        details.append("\n")
-        
-        details.append(f"  Cheek Color:   {preset.cheeks_color_intensity}\n")
-        if preset.cheeks_color_intensity > 0:
-            details.append(f"    Color: RGB({preset.cheek_color_r}, {preset.cheek_color_g}, {preset.cheek_color_b})\n")
-        details.append("\n")
-        
-        details.append(f"  Eye Liner:     {preset.eye_liner}\n")
-        if preset.eye_liner > 0:
-            details.append(f"    Color: RGB({preset.eye_liner_color_r}, {preset.eye_liner_color_g}, {preset.eye_liner_color_b})\n")
-        details.append("\n")
-        
-        details.append(f"  Eye Shadow (Lower): {preset.eye_shadow_lower}\n")
-        if preset.eye_shadow_lower > 0:
-            details.append(f"    Color: RGB({preset.eye_shadow_lower_color_r}, {preset.eye_shadow_lower_color_g}, {preset.eye_shadow_lower_color_b})\n")
-        details.append("\n")
-        
-        details.append(f"  Eye Shadow (Upper): {preset.eye_shadow_upper}\n")
-        if preset.eye_shadow_upper > 0:
-            details.append(f"    Color: RGB({preset.eye_shadow_upper_color_r}, {preset.eye_shadow_upper_color_g}, {preset.eye_shadow_upper_color_b})\n")
-        details.append("\n")
-        
-        details.append(f"  Lip Stick:     {preset.lip_stick}\n")
-        if preset.lip_stick > 0:
-            details.append(f"    Color: RGB({preset.lip_stick_color_r}, {preset.lip_stick_color_g}, {preset.lip_stick_color_b})\n")
-        details.append("\n")
-        
-        # TATTOO/MARK
-        details.append("TATTOO/MARK:\n")
-        details.append(f"  Horizontal Position: {preset.tattoo_mark_position_horizontal}\n")
-        details.append(f"  Vertical Position:   {preset.tattoo_mark_position_vertical}\n")
-        details.append(f"  Angle:               {preset.tattoo_mark_angle}\n")
-        details.append(f"  Expansion:           {preset.tattoo_mark_expansion}\n")
-        details.append(f"  Color:               RGB({preset.tattoo_mark_color_r}, {preset.tattoo_mark_color_g}, {preset.tattoo_mark_color_b})\n")
-        details.append(f"  Flip:                {preset.tattoo_mark_flip}\n\n")
-        
-        # BODY HAIR
-        details.append("BODY HAIR:\n")
-        details.append(f"  Intensity: {preset.body_hair}\n")
-        if preset.body_hair > 0:
-            details.append(f"  Color:     RGB({preset.body_hair_color_r}, {preset.body_hair_color_g}, {preset.body_hair_color_b})\n")
-        
-        details.append(f"\n{'='*60}\n")
-        
-        text_widget.insert(1.0, "".join(details))
+        text_widget.tag_configure("header", font=("Consolas", 9, "bold"))
+        
+        text, header_spans = self._format_preset_details(preset)
+        text_widget.insert(1.0, text)
+        for start, end in header_spans:
+            text_widget.tag_add("header", f"1.0 + {start} chars", f"1.0 + {end} chars")
         text_widget.config(state=tk.DISABLED)
         
         ttk.Button(
@@ -574,13 +582,32 @@ class PresetManagerGUI:
             style="Accent.TButton",
         ).pack(pady=10)
         
+    def _format_preset_details(self, preset):
+        """
+        Render the detail popup text for a preset.
+        
+        Returns the text and the (start, end) character offsets of each
+        section header, for tagging after a single insert.
+        """
+        values = preset.detail_values(self.selected_slot + 1)
+        preamble, sections = self.detail_sections
+        parts = [preamble.format_map(values)]
+        offset = len(parts[0])
+        header_spans = []
+        for header, body in sections:
+            header_spans.append((offset, offset + len(header)))
+            body = body.format_map(values)
+            parts += (header, body)
+            offset += len(header) + len(body)
+        return "".join(parts), header_spans
+        
     def export_presets(self):
         """Export presets to JSON"""
-        if not self.current_save:
-            messagebox.showerror("Error", "No save file loaded")
+        if not self.controller.save_obj:
+            self.messagebox.showerror("Error", "No save file loaded")
             return
         
-        filepath = filedialog.asksaveasfilename(
+        filepath = self.filedialog.asksaveasfilename(
             title="Export Presets",
             defaultextension=".json",
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
@@ -590,25 +617,26 @@ class PresetManagerGUI:
             return
         
         try:
-            count = self.current_save.export_presets(filepath)
-            messagebox.showinfo(
+            count = self.controller.export(filepath)
+            self.messagebox.showinfo(
                 "Export Successful",
                 f"Exported {count} preset(s) to:\n{os.path.basename(filepath)}"
             )
             self.status_var.set(f"Exported {count} presets")
         except Exception as e:
-            messagebox.showerror("Export Failed", f"Failed to export presets:\n{str(e)}")
-            import traceback
-            traceback.print_exc()
+            self.messagebox.showerror("Export Failed", f"Failed to export presets:\n{str(e)}")
+            if DEBUG:
+                import traceback
+                traceback.print_exc()
 
     def import_preset(self):
         """Import preset from JSON file"""
-        if not self.current_save:
-            messagebox.showerror("Error", "No save file loaded")
+        if not self.controller.save_obj:
+            self.messagebox.showerror("Error", "No save file loaded")
             return
         
         # Select JSON file
-        json_path = filedialog.askopenfilename(
+        json_path = self.filedialog.askopenfilename(
             title="Select Preset JSON File",
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
         )
@@ -621,35 +649,24 @@ class PresetManagerGUI:
         
     def show_import_dialog(self, json_path):
         """Show dialog for importing preset from JSON"""
-        import json
-        
         # Load JSON to show available presets
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            presets_meta = read_preset_summaries(json_path)
             
-            if 'presets' not in data or len(data['presets']) == 0:
-                messagebox.showerror("Error", "No presets found in JSON file")
+            if not presets_meta:
+                self.messagebox.showerror("Error", "No presets found in JSON file")
                 return
             
-            presets = data['presets']
-            
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load JSON file:\n{str(e)}")
+            self.messagebox.showerror("Error", f"Failed to load JSON file:\n{str(e)}")
             return
         
         # Create dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Import Preset from JSON")
-        dialog.geometry("600x300")
+        self._center_window(dialog, 600, 300)
         dialog.grab_set()
         
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"600x300+{x}+{y}")
-        
         frame = ttk.Frame(dialog, padding=20)
         frame.pack(fill=tk.BOTH, expand=True)
         
@@ -660,25 +677,22 @@ class PresetManagerGUI:
         ).grid(row=0, column=0, columnspan=3, pady=(0, 15))
         
         # Preset selection
-        ttk.Label(frame, text="Select Preset from JSON:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        
         preset_var = tk.StringVar()
         preset_options = []
-        for i, preset_entry in enumerate(presets):
-            slot = preset_entry.get('slot', i)
-            preset_data = preset_entry.get('data', {})
-            body_type = "Type A" if preset_data.get('body_type', 0) == 0 else "Type B"
+        for i, (slot, body_type_id) in enumerate(presets_meta):
+            body_type = "Type A" if body_type_id == 0 else "Type B"
             preset_options.append(f"Preset {i+1} (Original Slot {slot+1}, {body_type})")
         
         preset_combo = ttk.Combobox(frame, textvariable=preset_var, values=preset_options, state="readonly", width=40)
-        preset_combo.grid(row=1, column=1, columnspan=2, padx=5)
         preset_combo.current(0)
         
-        ttk.Label(frame, text="Destination Slot (1-15):").grid(row=2, column=0, sticky=tk.W, pady=5)
-        
         dest_slot_var = tk.StringVar(value="1")
-        dest_slot_entry = ttk.Entry(frame, textvariable=dest_slot_var, width=10)
-        dest_slot_entry.grid(row=2, column=1, sticky=tk.W, padx=5)
+        
+        _grid_form(frame, (
+            ("Select Preset from JSON:", preset_combo, {"columnspan": 2}),
+            ("Destination Slot (1-15):",
+             ttk.Entry(frame, textvariable=dest_slot_var, width=10), {"sticky": tk.W}),
+        ))
         
         def do_import():
             try:
@@ -687,63 +701,89 @@ class PresetManagerGUI:
                 
                 dest_slot = int(dest_slot_var.get())
                 if dest_slot < 1 or dest_slot > 15:
-                    messagebox.showerror("Error", "Slot must be between 1 and 15")
+                    self.messagebox.showerror("Error", "Slot must be between 1 and 15")
                     return
                 
                 # Import preset
-                success = self.current_save.import_preset_from_json(
+                success = self.controller.import_preset(
                     json_path, preset_index - 1, dest_slot - 1
                 )
                 
                 if success:
-                    # Create backup
-                    import shutil
-                    backup_path = self.current_save_path + ".backup"
-                    shutil.copy2(self.current_save_path, backup_path)
+                    # Back up and write the save on the worker thread
+                    backup = Path(self.controller.save_path + ".backup")
+                    future = self._executor.submit(self.controller.save, backup)
                     
-                    # Save modified file
-                    self.current_save.save(self.current_save_path)
+                    _set_dialog_busy(dialog, True, (import_button, cancel_button))
+                    progress.grid(row=4, column=0, columnspan=3, sticky=tk.EW, pady=(15, 0))
+                    progress.start()
+                    self.status_var.set("Saving...")
                     
-                    # Reload presets to show changes
-                    self.current_save = Save.from_file(self.current_save_path)
-                    self.presets = self.current_save.get_character_presets()
-                    self.populate_preset_list()
-                    
-                    messagebox.showinfo(
-                        "Import Successful",
-                        f"Preset imported successfully to slot {dest_slot}!\n\n"
-                        f"Backup created: {os.path.basename(backup_path)}"
-                    )
-                    dialog.destroy()
+                    self._when_done(future, lambda f: finish_import(f, dest_slot, backup))
                 else:
-                    messagebox.showerror(
+                    self.messagebox.showerror(
                         "Import Failed",
                         "Failed to import preset.\n\n"
                         "Check that the JSON file is valid and the slot is available."
                     )
                     
             except ValueError:
-                messagebox.showerror("Error", "Invalid slot number - must be an integer (1-15)")
+                self.messagebox.showerror("Error", "Invalid slot number - must be an integer (1-15)")
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to import preset:\n{str(e)}")
-                import traceback
-                traceback.print_exc()
+                self.messagebox.showerror("Error", f"Failed to import preset:\n{str(e)}")
+                if DEBUG:
+                    import traceback
+                    traceback.print_exc()
+        
+        def finish_import(save_future, dest_slot, backup):
+            progress.stop()
+            progress.grid_remove()
+            _set_dialog_busy(dialog, False, (import_button, cancel_button))
+            
+            try:
+                save_future.result()
+            except Exception as e:
+                self.status_var.set("Error")
+                self.messagebox.showerror("Error", f"Failed to import preset:\n{str(e)}")
+                if DEBUG:
+                    import traceback
+                    traceback.print_exc()
+                return
+            
+            dialog.destroy()
+            
+            # The in-memory save already holds the imported preset, so only
+            # its row needs redrawing; the file's stat() is stale though
+            self._current_stat = None
+            self.update_preset_row(dest_slot - 1)
+            self.status_var.set(f"Imported preset to slot {dest_slot}")
+            
+            self.messagebox.showinfo(
+                "Import Successful",
+                f"Preset imported successfully to slot {dest_slot}!\n\n"
+                f"Backup created: {backup.name}"
+            )
         
         button_frame = ttk.Frame(frame)
         button_frame.grid(row=3, column=0, columnspan=3, pady=(15, 0))
         
-        ttk.Button(
+        import_button = ttk.Button(
             button_frame, text="Import Preset", command=do_import, width=15, style="Accent.TButton"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        import_button.pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(
+        cancel_button = ttk.Button(
             button_frame, text="Cancel", command=dialog.destroy, width=15
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        cancel_button.pack(side=tk.LEFT, padx=5)
+        
+        # Shown while the save is being written
+        progress = ttk.Progressbar(frame, mode="indeterminate")
             
     def copy_preset(self):
         """Copy selected preset to another save file"""
         if self.selected_slot is None:
-            messagebox.showerror("No Selection", "Please select a preset to copy!")
+            self.messagebox.showerror("No Selection", "Please select a preset to copy!")
             return
         
         # Show copy dialog
@@ -753,15 +793,9 @@ class PresetManagerGUI:
         """Show dialog for copying preset"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Copy Preset to Another Save")
-        dialog.geometry("600x220")
+        self._center_window(dialog, 600, 220)
         dialog.grab_set()
         
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"600x220+{x}+{y}")
-        
         frame = ttk.Frame(dialog, padding=20)
         frame.pack(fill=tk.BOTH, expand=True)
         
@@ -771,14 +805,11 @@ class PresetManagerGUI:
             font=("Segoe UI", 11, "bold"),
         ).grid(row=0, column=0, columnspan=3, pady=(0, 15))
         
-        ttk.Label(frame, text="Destination Save File:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        
         dest_path_var = tk.StringVar()
         dest_entry = ttk.Entry(frame, textvariable=dest_path_var, width=45)
-        dest_entry.grid(row=1, column=1, padx=5)
         
         def browse_dest():
-            filename = filedialog.askopenfilename(
+            filename = self.filedialog.askopenfilename(
                 title="Select Destination Save File",
                 initialdir=self.default_save_path,
                 filetypes=[("Elden Ring Saves", "*.sl2 *.co2"), ("All Files", "*.*")],
@@ -790,74 +821,92 @@ class PresetManagerGUI:
             frame, text="Browse", command=browse_dest, style="Accent.TButton"
         ).grid(row=1, column=2, padx=5)
         
-        ttk.Label(frame, text="Destination Slot (1-15):").grid(row=2, column=0, sticky=tk.W, pady=5)
-        
         dest_slot_var = tk.StringVar(value="1")
-        dest_slot_entry = ttk.Entry(frame, textvariable=dest_slot_var, width=10)
-        dest_slot_entry.grid(row=2, column=1, sticky=tk.W, padx=5)
+        
+        _grid_form(frame, (
+            ("Destination Save File:", dest_entry, {}),
+            ("Destination Slot (1-15):",
+             ttk.Entry(frame, textvariable=dest_slot_var, width=10), {"sticky": tk.W}),
+        ))
         
         def do_copy():
             dest_path = dest_path_var.get()
-            if not dest_path or not os.path.exists(dest_path):
-                messagebox.showerror("Error", "Please select a valid destination save file")
+            dest = Path(dest_path)
+            if not dest_path or not dest.exists():
+                self.messagebox.showerror("Error", "Please select a valid destination save file")
                 return
             
             try:
                 dest_slot = int(dest_slot_var.get())
                 if dest_slot < 1 or dest_slot > 15:
-                    messagebox.showerror("Error", "Slot must be between 1 and 15")
+                    self.messagebox.showerror("Error", "Slot must be between 1 and 15")
                     return
-                
-                # Load destination save
-                dest_save = Save.from_file(dest_path)
-                
-                # Copy preset
-                success = dest_save.copy_preset_to_save(
-                    self.current_save, self.selected_slot, dest_slot - 1
-                )
-                
-                if success:
-                    # Create backup
-                    backup_path = dest_path + ".backup"
-                    shutil.copy2(dest_path, backup_path)
-                    
-                    # Save modified file
-                    dest_save.save(dest_path)
-                    
-                    messagebox.showinfo(
-                        "Copy Successful",
-                        f"Preset copied successfully!\n\n"
-                        f"From: Slot {self.selected_slot + 1}\n"
-                        f"To: {os.path.basename(dest_path)} - Slot {dest_slot}\n\n"
-                        f"Backup created: {os.path.basename(backup_path)}"
-                    )
-                    dialog.destroy()
-                else:
-                    messagebox.showerror(
-                        "Copy Failed",
-                        "Failed to copy preset.\n\n"
-                        "Possible reasons:\n"
-                        "- Source preset slot is empty\n"
-                        "- Invalid slot numbers"
-                    )
-                    
             except ValueError:
-                messagebox.showerror("Error", "Invalid slot number - must be an integer (1-15)")
+                self.messagebox.showerror("Error", "Invalid slot number - must be an integer (1-15)")
+                return
+            
+            # Load, back up and write the destination on the worker thread
+            source_slot = self.selected_slot
+            backup = dest.with_name(dest.name + ".backup")
+            future = self._executor.submit(
+                self.controller.copy_preset_to, dest_path, source_slot, dest_slot - 1, backup
+            )
+            
+            _set_dialog_busy(dialog, True, (copy_button, cancel_button))
+            self.status_var.set("Copying...")
+            self._when_done(
+                future, lambda f: finish_copy(f, source_slot, dest, dest_slot, backup)
+            )
+        
+        def finish_copy(copy_future, source_slot, dest, dest_slot, backup):
+            _set_dialog_busy(dialog, False, (copy_button, cancel_button))
+            
+            try:
+                success = copy_future.result()
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to copy preset:\n{str(e)}")
-                import traceback
-                traceback.print_exc()
+                self.status_var.set("Error")
+                self.messagebox.showerror("Error", f"Failed to copy preset:\n{str(e)}")
+                if DEBUG:
+                    import traceback
+                    traceback.print_exc()
+                return
+            
+            if success:
+                if self.controller.is_loaded(dest):
+                    # Copied within the loaded save, which was patched in memory
+                    self._current_stat = None
+                    self.update_preset_row(dest_slot - 1)
+                self.status_var.set(f"Copied preset to {dest.name}")
+                self.messagebox.showinfo(
+                    "Copy Successful",
+                    f"Preset copied successfully!\n\n"
+                    f"From: Slot {source_slot + 1}\n"
+                    f"To: {dest.name} - Slot {dest_slot}\n\n"
+                    f"Backup created: {backup.name}"
+                )
+                dialog.destroy()
+            else:
+                self.status_var.set("Copy failed")
+                self.messagebox.showerror(
+                    "Copy Failed",
+                    "Failed to copy preset.\n\n"
+                    "Possible reasons:\n"
+                    "- Source preset slot is empty\n"
+                    "- Invalid slot numbers"
+                )
         
         button_frame = ttk.Frame(frame)
         button_frame.grid(row=3, column=0, columnspan=3, pady=(15, 0))
         
-        ttk.Button(
+        copy_button = ttk.Button(
             button_frame, text="Copy Preset", command=do_copy, width=15, style="Accent.TButton"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        copy_button.pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(
+        cancel_button = ttk.Button(
             button_frame, text="Cancel", command=dialog.destroy, width=15
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        cancel_button.pack(side=tk.LEFT, padx=5)
 
 
 def main():
@@ -15,6 +15,7 @@ build_exe_options = {
         "tkinter",
         "elden_ring_save_parser_lib",
         "character_presets",
+        "preset_controller",
     ],
     "includes": [
         "elden_ring_save_parser_lib.save",
@@ -44,8 +45,16 @@ build_exe_options = {
         "test",
         "tkinter.test",
         "asyncio",
-        "concurrent",
         "multiprocessing",
+        # Standard library the tools never import
+        "lib2to3",
+        "ensurepip",
+        "venv",
+        "turtle",
+        "idlelib",
+        "sqlite3",
+        "ssl",
+        "ctypes.test",
     ],
     "optimize": 2,
     "include_msvcr": False,
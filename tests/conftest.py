@@ -0,0 +1,45 @@
+"""
+Shared test helpers: synthetic save files with a known preset block
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The app modules (character_presets, ...) live at the repository root
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from elden_ring_save_parser_lib.save import (  # noqa: E402
+    CHECKSUM_SIZE,
+    PRESETS_OFFSET,
+    PRESETS_SIZE,
+    PS_MAGIC,
+    USER_DATA_10_SIZE,
+    _userdata10_offset,
+)
+
+USER_DATA_11_SIZE = 0x240010
+
+
+def build_save(magic: bytes, seed: int = 0) -> bytes:
+    """
+    A save of the given platform with empty character slots and a random
+    preset block, sized to cover USER_DATA_10 and USER_DATA_11
+    """
+    userdata10 = _userdata10_offset(magic)
+    checksum = 0 if magic == PS_MAGIC else CHECKSUM_SIZE
+    data = bytearray(userdata10 + USER_DATA_10_SIZE + checksum + USER_DATA_11_SIZE)
+    data[:4] = magic
+    start = userdata10 + PRESETS_OFFSET
+    data[start : start + PRESETS_SIZE] = random.Random(seed).randbytes(PRESETS_SIZE)
+    return bytes(data)
+
+
+@pytest.fixture(params=[b"BND4", PS_MAGIC], ids=["pc", "ps"])
+def save_path(request, tmp_path):
+    """Path of a synthetic PC or PlayStation save"""
+    path = tmp_path / "ER0000.sl2"
+    path.write_bytes(build_save(request.param))
+    return path
@@ -0,0 +1,39 @@
+import random
+
+from character_presets import FACE_PRESET_SIZE, FacePreset
+
+
+def test_face_preset_size():
+    assert FACE_PRESET_SIZE == 0x130
+
+
+def test_face_preset_round_trip():
+    # Padding after each face model is not kept, so it is zero in the input
+    block = bytearray(random.Random(0).randbytes(FACE_PRESET_SIZE))
+    for model in range(8):
+        start = 0x24 + model * 4 + 1
+        block[start : start + 3] = bytes(3)
+    block = bytes(block)
+
+    preset = FacePreset.from_bytes(block)
+
+    assert preset.to_bytes() == block
+
+
+def test_face_preset_from_bytes_offset():
+    block = random.Random(1).randbytes(FACE_PRESET_SIZE)
+    buf = bytes(8) + block
+
+    assert FacePreset.from_bytes(buf, 8) == FacePreset.from_bytes(block)
+
+
+def test_rgb_strings_follow_field_changes():
+    preset = FacePreset.from_bytes(bytes(FACE_PRESET_SIZE))
+    assert preset.skin_rgb_str == "RGB(  0,  0,  0)"
+    assert preset.rgb_str("lip_stick_color") == "RGB(0, 0, 0)"
+
+    preset.skin_color_r = 255
+    preset.lip_stick_color_b = 7
+
+    assert preset.skin_rgb_str == "RGB(255,  0,  0)"
+    assert preset.rgb_str("lip_stick_color") == "RGB(0, 0, 7)"
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from character_presets import FacePreset
+from elden_ring_save_parser_lib.save import Save
+from preset_controller import PresetController
+
+
+def test_failed_save_undoes_import(save_path, tmp_path, monkeypatch):
+    controller = PresetController()
+    controller.load(str(save_path))
+    presets = [p.to_bytes() for p in controller.presets.presets]
+    raw = bytes(controller.save_obj._raw_data)
+
+    preset = FacePreset.from_bytes(presets[0])
+    preset.magic = b"FACE"
+    json_path = tmp_path / "presets.json"
+    json_path.write_text(json.dumps({"presets": [{"slot": 0, "data": preset.to_dict()}]}))
+    assert controller.import_preset(str(json_path), 0, 1)
+    assert controller.active_presets()
+
+    def failing_save_atomic(self, filepath=None, backup_path=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Save, "save_atomic", failing_save_atomic)
+
+    with pytest.raises(OSError, match="disk full"):
+        controller.save(tmp_path / "backup")
+
+    assert [p.to_bytes() for p in controller.presets.presets] == presets
+    assert bytes(controller.save_obj._raw_data) == raw
+    assert controller.active_presets() == []
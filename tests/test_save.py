@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+from elden_ring_save_parser_lib.save import Save
+
+
+def test_read_character_presets_matches_full_parse(save_path):
+    presets = Save.read_character_presets(save_path)
+    parsed = Save.from_file(save_path).get_character_presets()
+
+    assert (presets.unk0x0, presets.unk0x2, presets.size) == (
+        parsed.unk0x0,
+        parsed.unk0x2,
+        parsed.size,
+    )
+    assert [p.to_bytes() for p in presets.presets] == [p.to_bytes() for p in parsed.presets]
+
+
+def test_save_atomic_failure_keeps_original(save_path, monkeypatch):
+    original = save_path.read_bytes()
+    save = Save.from_file(save_path)
+    save._raw_data[-1] ^= 0xFF
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+
+    with pytest.raises(OSError, match="disk full"):
+        save.save_atomic(save_path)
+
+    assert save_path.read_bytes() == original
+    assert not os.path.exists(f"{save_path}.tmp")